@@ -7,8 +7,11 @@ import math
 import random
 import json
 import os
+import signal
+import zlib
+from functools import lru_cache
 from pathlib import Path
-from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 from colors import *
 from constants import *
@@ -43,6 +46,32 @@ CAT_SYNC_ANTENNA_FROM_STATUS = True
 # Common baud rates for ham radios
 BAUD_RATES_TO_TRY = [4800, 9600, 19200, 38400, 57600]
 
+# Status record mode bits (low-order trio) indexed directly; unmapped codes decode to None
+STATUS_MODE_MAP = ("LSB", "USB", "CW", "AM", "FM", None, None, None)
+
+# SHIFT/WIDTH/NOTCH indicator line end offsets for each value 0-100
+# (0-100 maps to -135° to +135°, 23 px long, rounded to whole pixels)
+KNOB_LINE_OFFSETS = tuple(
+    (round(23 * math.sin(math.radians(v / 100.0 * 270 - 135))),
+     round(-23 * math.cos(math.radians(v / 100.0 * 270 - 135))))
+    for v in range(101)
+)
+
+# ASCII digits for keypad/frequency parsing (set lookup, and no Unicode digits)
+DIGITS = frozenset("0123456789")
+
+# CONTOUR button display per contour_mode (0=OFF, 1=Low-Cut, 2=Mid-Cut, 3=High-Cut)
+CONTOUR_MODE_LABELS = ("OFF", "L-CUT", "M-CUT", "H-CUT")
+CONTOUR_LED_COLORS = (COLOR_LED_OFF, "#ffaa00", "#00ff00", "#00aaff")  # OFF, orange, green, blue
+
+# Sideband switch point (LSB below, USB at/above), in 10 Hz units (10 MHz)
+MODE_SWITCH_FREQ_10HZ = 1000000
+
+# Mock-mode signal fading: |sin(t * 5)| * 200 precomputed for 60 s of 50 ms
+# simulation ticks; simulate_radio steps through it as a ring buffer.
+SIM_RING_SIZE = 1200
+SIM_BASE_SIGNAL = tuple(int(abs(math.sin(i * 0.05 * 5)) * 200) for i in range(SIM_RING_SIZE))
+
 
 def resolve_serial_settings():
     """Return serial settings, preferring explicit config over auto-detection."""
@@ -90,18 +119,36 @@ def cat_debug_log(direction, payload):
 
 def frequency_display_to_10hz(freq_display):
     """Convert XX.XXX.XX-style display frequency into 10 Hz units."""
-    digits = "".join(ch for ch in str(freq_display) if ch.isdigit())
+    digits = "".join(ch for ch in str(freq_display) if ch in DIGITS)
     if not digits:
         return None
     return int(digits)
 
 
+@lru_cache(maxsize=4096)
 def frequency_10hz_to_display(freq_10hz):
-    """Convert 10 Hz units to XX.XXX.XX-style display frequency."""
-    freq_str = f"{int(freq_10hz):07d}"
-    if len(freq_str) == 6:
-        return f"{freq_str[0]}.{freq_str[1:4]}.{freq_str[4:6]}"
-    return f"{freq_str[0:2]}.{freq_str[2:5]}.{freq_str[5:7]}"
+    """Convert 10 Hz units to XX.XXX.XX-style display frequency (X.XXX.XX below 10 MHz)."""
+    mhz, rest = divmod(int(freq_10hz), 100000)
+    khz, hz10 = divmod(rest, 100)
+    return f"{mhz}.{khz:03d}.{hz10:02d}"
+
+
+def smooth_toward(level, target, factor):
+    """Move a meter level a fraction of the way to its target, snapping when within 1."""
+    delta = target - level
+    if -1 < delta < 1:
+        return target
+    return level + delta * factor
+
+
+@lru_cache(maxsize=16)
+def format_entry_display(entry_buffer):
+    """Format a partial keypad entry as XX.XXX.XX with '_' for digits not yet typed."""
+    padded = entry_buffer.ljust(8, '_')
+    display = f"{padded[0:2]}.{padded[2:5]}.{padded[5:7]}"
+    if display.startswith("_"):
+        display = " " + display[1:]
+    return display
 
 
 def decode_frequency_candidates_from_cat_bytes(freq_bytes):
@@ -168,11 +215,12 @@ def decode_status_vfo_pair_10hz(status_data):
     return vfo_a, vfo_b
 
 
-def choose_stable_vfo_assignment(decoded_1, decoded_2, current_a_display, current_b_display):
+def choose_stable_vfo_assignment(decoded_1, decoded_2, cur_a, cur_b):
     """Assign decoded frequencies to VFO-A/VFO-B with minimum jump from current UI state.
 
     Some rigs/firmware report current/other order instead of fixed A/B order.
-    This chooser keeps labels stable by selecting the mapping closest to existing A/B values.
+    This chooser keeps labels stable by selecting the mapping closest to existing A/B values
+    (all frequencies in 10 Hz units).
     """
     if decoded_1 is None:
         return None, None
@@ -180,11 +228,6 @@ def choose_stable_vfo_assignment(decoded_1, decoded_2, current_a_display, curren
     if decoded_2 is None:
         return decoded_1, None
 
-    cur_a = frequency_display_to_10hz(current_a_display)
-    cur_b = frequency_display_to_10hz(current_b_display)
-    if cur_a is None or cur_b is None:
-        return decoded_1, decoded_2
-
     direct_cost = abs(decoded_1 - cur_a) + abs(decoded_2 - cur_b)
     swapped_cost = abs(decoded_2 - cur_a) + abs(decoded_1 - cur_b)
     if swapped_cost < direct_cost:
@@ -198,15 +241,7 @@ def decode_status_mode(byte_value):
     Manual examples represent mode in the low-order trio (e.g. ...010 => CW),
     with other bits used for flags/dummy values.
     """
-    mode_code = byte_value & 0x07
-    mode_map = {
-        0b000: "LSB",
-        0b001: "USB",
-        0b010: "CW",
-        0b011: "AM",
-        0b100: "FM",
-    }
-    return mode_map.get(mode_code)
+    return STATUS_MODE_MAP[byte_value & 0x07]
 
 
 def decode_status_antenna(byte_value):
@@ -230,8 +265,8 @@ def decode_status_transmitting(byte_value):
     return bool(byte_value & 0x20)
 
 
-def select_frequency_from_stream(stream_bytes, current_freq_display):
-    """Scan a raw CAT byte stream and pick the most plausible frequency."""
+def select_frequency_from_stream(stream_bytes, current_10hz):
+    """Scan a raw CAT byte stream and pick the most plausible frequency (10 Hz units)."""
     if len(stream_bytes) < 4:
         return None
 
@@ -246,16 +281,10 @@ def select_frequency_from_stream(stream_bytes, current_freq_display):
 
     # Keep order while removing duplicates.
     candidates = list(dict.fromkeys(candidates))
-    current_10hz = frequency_display_to_10hz(current_freq_display)
-    if current_10hz is None:
-        selected_10hz = candidates[0]
-    else:
-        selected_10hz = min(candidates, key=lambda f: abs(f - current_10hz))
-
-    return frequency_10hz_to_display(selected_10hz)
+    return min(candidates, key=lambda f: abs(f - current_10hz))
 
 
-def has_valid_frequency_in_payload(payload, opcode, status_param, current_freq_display):
+def has_valid_frequency_in_payload(payload, opcode, status_param, current_10hz):
     """Validate whether a payload contains a usable frequency for a given query type."""
     if not payload:
         return False
@@ -264,12 +293,12 @@ def has_valid_frequency_in_payload(payload, opcode, status_param, current_freq_d
         vfo_a_10hz, _ = decode_status_vfo_pair_10hz(payload)
         return vfo_a_10hz is not None
 
-    return select_frequency_from_stream(payload, current_freq_display) is not None
+    return select_frequency_from_stream(payload, current_10hz) is not None
 
 
 def encode_frequency_to_cat_bytes(freq_display, lsb_first=True):
     """Encode XX.XXX.XX display frequency into 4 packed-BCD CAT bytes."""
-    digits = "".join(ch for ch in str(freq_display) if ch.isdigit())
+    digits = "".join(ch for ch in str(freq_display) if ch in DIGITS)
     if not digits:
         raise ValueError("Frequency contains no digits")
     digits = digits.rjust(7, "0")
@@ -345,25 +374,41 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
     """HTTP API request handler for remote radio control"""
     
     radio_app = None  # Will be set to the HamSimulatorApp instance
+    timeout = 5  # Seconds; requests are served one at a time, so don't let a stalled client hold the server
     
     def log_message(self, format, *args):
         """Override to suppress default logging (optional)"""
         pass  # Comment this out to enable request logging
     
-    def _set_headers(self, status=200, content_type='application/json'):
+    def _set_headers(self, status=200, content_type='application/json', etag=None):
         """Set HTTP response headers with CORS support"""
         self.send_response(status)
         self.send_header('Content-Type', content_type)
         self.send_header('Access-Control-Allow-Origin', '*')  # CORS
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type, If-None-Match')
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Access-Control-Expose-Headers', 'ETag')
         self.end_headers()
     
     def _send_json(self, data, status=200):
         """Send JSON response"""
+        if self.command != 'GET' and self.radio_app:
+            self.radio_app.needs_redraw = True  # State may have changed; redraw on next fallback tick
         self._set_headers(status)
         self.wfile.write(json.dumps(data).encode())
     
+    def _send_json_cached(self, data):
+        """Send JSON with an ETag; answer 304 with no body if the client already has it"""
+        body = json.dumps(data).encode()
+        etag = f'W/"{zlib.crc32(body):08x}"'
+        if self.headers.get('If-None-Match') == etag:
+            self._set_headers(304, etag=etag)
+            return
+        self._set_headers(200, etag=etag)
+        self.wfile.write(body)
+    
     def _send_error_json(self, message, status=400):
         """Send error response"""
         self._send_json({'error': message, 'success': False}, status)
@@ -387,7 +432,7 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
         if isinstance(value, (int, float)):
             freq_mhz = float(value)
         elif isinstance(value, str):
-            digits = "".join(ch for ch in value if ch.isdigit())
+            digits = "".join(ch for ch in value if ch in DIGITS)
             if not digits:
                 raise ValueError("Invalid frequency format")
             if len(digits) <= 2:
@@ -403,11 +448,7 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
         if not (1.8 <= freq_mhz <= 30.0):
             raise ValueError("Frequency must be between 1.8 and 30.0 MHz")
 
-        freq_10hz = int(round(freq_mhz * 100000))
-        freq_str = f"{freq_10hz:07d}"
-        if len(freq_str) == 6:
-            return f"{freq_str[0]}.{freq_str[1:4]}.{freq_str[4:6]}"
-        return f"{freq_str[0:2]}.{freq_str[2:5]}.{freq_str[5:7]}"
+        return frequency_10hz_to_display(int(round(freq_mhz * 100000)))
     
     def do_OPTIONS(self):
         """Handle CORS preflight requests"""
@@ -435,6 +476,7 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
                     active_nr = freq
                     break
             
+            s_meter, power_meter, swr_meter = self.radio_app.meter_readings()
             status = {
                 'success': True,
                 'frequency_a': self.radio_app.frequency,
@@ -453,9 +495,9 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
                 'notch': self.radio_app.notch,
                 'antenna': self.radio_app.antenna,
                 'tuner_active': self.radio_app.tuner_active,
-                'meter_level': self.radio_app.meter_level,
-                'power_meter_level': self.radio_app.power_meter_level,
-                'swr_level': self.radio_app.swr_level,
+                'meter_level': s_meter,
+                'power_meter_level': power_meter,
+                'swr_level': swr_meter,
                 'mock_mode': MOCK_MODE,
                 'selected_memory': self.radio_app.selected_memory,
                 # APF and NR status
@@ -465,7 +507,7 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
                 'nr_frequency': active_nr,
                 'contour_mode': self.radio_app.contour_mode,
             }
-            return self._send_json(status)
+            return self._send_json_cached(status)
         
         # GET /api/frequency - Current frequency (active VFO)
         elif path == '/api/frequency':
@@ -556,7 +598,7 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
                 'success': True,
                 'power_level_setting': self.radio_app.power_level,
                 'power_meter': rf_power,
-                'power_meter_level': self.radio_app.power_meter_level,
+                'power_meter_level': self.radio_app.meter_readings()[1],
             })
         
         # GET /api/af_gain - AF Gain status
@@ -577,11 +619,12 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
         
         # GET /api/meters - All meter readings from radio
         elif path == '/api/meters':
+            s_meter, power_meter, swr_meter = self.radio_app.meter_readings()
             meters = {
                 'success': True,
-                's_meter': self.radio_app.meter_level,
-                'power_meter': self.radio_app.power_meter_level,
-                'swr_meter': self.radio_app.swr_level,
+                's_meter': s_meter,
+                'power_meter': power_meter,
+                'swr_meter': swr_meter,
             }
             # Try to read live values if connected
             if not MOCK_MODE and self.radio_app.serial_port:
@@ -704,9 +747,76 @@ class RadioAPIHandler(BaseHTTPRequestHandler):
                         updated[control] = value
             except (TypeError, ValueError):
                 return self._send_error_json("Control values must be integers between 0 and 100")
+            finally:
+                # Flag after the values are written so a redraw can't clear it and draw stale ones
+                if updated:
+                    self.radio_app.sliders_dirty = True
             
             return self._send_json({'success': True, 'updated': updated})
         
+        # POST /api/batch - Set frequency/mode/split/controls in one request
+        elif path == '/api/batch':
+            vfo = data.get('vfo', self.radio_app.active_vfo)
+            if vfo not in ["A", "B"]:
+                return self._send_error_json("VFO must be 'A' or 'B'")
+
+            # Validate every field before applying any of them
+            normalized_freq = None
+            if 'frequency' in data:
+                try:
+                    normalized_freq = self._normalize_frequency(data['frequency'])
+                except ValueError as e:
+                    return self._send_error_json(str(e))
+
+            mode = data.get('mode')
+            valid_modes = ["LSB", "USB", "CW", "AM", "FM"]
+            if mode is not None and mode not in valid_modes:
+                return self._send_error_json(f"Invalid mode. Must be one of: {valid_modes}")
+
+            split = None
+            if 'split' in data:
+                try:
+                    split = self._parse_bool(data['split'])
+                except ValueError:
+                    return self._send_error_json("'split' must be a boolean")
+
+            controls = {}
+            try:
+                for control in ['af_gain', 'sub_af_gain', 'rf_gain', 'power_level', 'shift', 'width', 'notch']:
+                    if control in data:
+                        controls[control] = max(0, min(100, int(data[control])))
+            except (TypeError, ValueError):
+                return self._send_error_json("Control values must be integers between 0 and 100")
+
+            result = {'success': True, 'vfo': vfo}
+            if normalized_freq is not None:
+                if vfo == "A":
+                    self.radio_app.frequency = normalized_freq
+                else:
+                    self.radio_app.frequency_vfo_b = normalized_freq
+                # Band default first; an explicit 'mode' below overrides it
+                self.radio_app.set_mode_for_frequency(vfo)
+                self.radio_app.send_frequency_to_radio(vfo)
+                result['frequency'] = normalized_freq
+            if mode is not None:
+                if vfo == "A":
+                    self.radio_app.mode = mode
+                else:
+                    self.radio_app.mode_vfo_b = mode
+            if normalized_freq is not None or mode is not None:
+                current_mode = self.radio_app.mode if vfo == "A" else self.radio_app.mode_vfo_b
+                self.radio_app.send_mode_to_radio(current_mode, vfo)
+                result['mode'] = current_mode
+            if split is not None:
+                self.radio_app.split_enabled = split
+                result['split_enabled'] = split
+            if controls:
+                for control, value in controls.items():
+                    setattr(self.radio_app, control, value)
+                self.radio_app.sliders_dirty = True
+                result['updated'] = controls
+            return self._send_json(result)
+        
         # POST /api/memory/:id - Store to memory
         elif path.startswith('/api/memory/') and '/store' in path:
             try:
@@ -904,14 +1014,19 @@ class HamSimulatorApp(ctk.CTk):
         self.settings_file = Path.home() / ".1k_monitor_settings.json"
         
         # Cache for display strings (optimization)
-        self.cached_freq_a = None
-        self.cached_freq_b = None
-        self.cached_mode_a = None
-        self.cached_mode_b = None
-        self.cached_antenna = None
-        self.cached_meter_level = -1
-        self.cached_transmitting = False
+        self.last_item_state = {}  # (canvas item id, option) -> last applied value
+        self.pending_item_options = {}  # canvas item id -> options to apply at end of frame
+        self.cached_current_mode = None
+        self.cached_meter_level = 0  # Lit segments per meter (all start dark)
+        self.cached_power_meter_level = 0
+        self.cached_swr_level = 0
+        self.cached_filter_state = None
+        self.cached_dimple_a = 0  # kHz digits the VFO dimples were last drawn at
+        self.cached_dimple_b = 0
+        self.cached_conn_state = None
         self.show_help = False
+        self.cached_show_help = False
+        self.cached_help_status = None
         
         # Serial connection tracking
         self.last_reconnect_attempt = 0
@@ -924,28 +1039,40 @@ class HamSimulatorApp(ctk.CTk):
         # Status message system
         self.status_message = None
         self.status_message_until = 0
+        self.cached_status_message = None  # Message currently shown on the banner
 
         # Data Variables
-        self.frequency = "14.320.00"
-        self.frequency_vfo_b = "18.120.00"
+        self.freq_a_10hz = 1432000  # Canonical VFO frequencies in 10 Hz units (14.320.00)
+        self.freq_b_10hz = 1812000  # (18.120.00); display strings are derived on read
         self.mode = "USB"
         self.mode_vfo_b = "LSB"
         self.meter_level = 0
         self.transmitting = False
         self.active_vfo = "A"
         self.running = True
+        self.stop_event = threading.Event()  # Set on close; wakes the radio thread from its waits
         self.af_gain = 50  # 0-100
         self.sub_af_gain = 50  # 0-100 (VFO B volume)
         self.rf_gain = 80  # 0-100
         self.power_level = 100  # 0-100 (transmit power)
         self.power_meter_level = 0  # 0-255 (output power meter)
         self.swr_level = 0  # 0-255 (SWR meter)
+        # Latest raw meter readings, written only by the radio thread (one int store each);
+        # the UI thread copies them into the *_level values above (smoothed in mock mode).
+        self.meter_target = 0
+        self.power_meter_target = 0
+        self.swr_target = 0
+        self.last_meter_step = time.monotonic()  # Mock-mode meter smoothing is time-based
+        self.sim_frame = 0  # Mock mode position in SIM_BASE_SIGNAL
+        self.sim_rng = random.Random()  # Mock mode noise; private to the radio thread
         self.radio_tx_active = False  # Actual TX state inferred from CAT status
         self.tx_meter_hold_until = 0.0  # Hold PO/SWR briefly across missed reads
         self.last_tx_meter_update = 0.0
         self.shift = 50  # 0-100 (IF shift)
         self.width = 50  # 0-100 (filter width)
         self.notch = 50  # 0-100 (notch filter)
+        self.sliders_dirty = True  # Redraw slider/knob positions on next frame
+        self.needs_redraw = True  # Face is stale; set by input, radio and API updates
         # Filter Matrix states
         self.apf_filters = {250: False, 500: False, 1000: False, 1500: False, 2000: False}
         self.nr_filters = {500: False, 1000: False, 1500: False, 2000: False, 3000: False}
@@ -958,10 +1085,12 @@ class HamSimulatorApp(ctk.CTk):
         self.freq_entry_mode = False
         self.vfo_a_last_angle = None  # Track last drag angle for VFO A
         self.vfo_b_last_angle = None  # Track last drag angle for VFO B
+        self.last_drag_time = 0.0  # Rate-limits VFO/knob drag handling
+        self.pending_drag = None  # Replays the last throttled drag event on release
         self.serial_port = None  # Serial port for radio communication
         self.serial_lock = threading.Lock()  # Protect serial port from concurrent access
         self.serial_profile_name = "unknown"
-        self.last_polled_freq = None
+        self.last_polled_freq = None  # Last polled VFO A frequency (10 Hz units)
         self.last_polled_freq_hits = 0
         
         # Memory Channels (10 channels for storing freq + mode pairs)
@@ -976,6 +1105,11 @@ class HamSimulatorApp(ctk.CTk):
         
         # Dynamic Elements (Store IDs for updating)
         self.ui_elements = {}
+        self.slider_items = []  # (value attr, thumb id, value text id, x, y, width) per slider
+        self.knob_items = []  # (value attr, line id, value text id, x, y) per knob
+        self.mode_led_ids = {}  # mode name -> mode button LED id
+        self.slider_geometry = {}  # slider id -> (x, width, min, max) for drag handling
+        self.knob_last_angle = {}  # knob id -> last drag angle (None when not dragging)
 
         # Canvas Setup (The Radio Face)
         self.canvas = ctk.CTkCanvas(self, width=WINDOW_WIDTH, height=WINDOW_HEIGHT, bg=COLOR_CHASSIS, highlightthickness=0)
@@ -990,6 +1124,12 @@ class HamSimulatorApp(ctk.CTk):
         self.draw_connection_status()
         
         self.init_dynamic_display()
+        self.draw_help_overlay()
+        self.draw_status_banner()
+        self.bind_item_ids()
+        # Static art never takes input; disabled items are skipped when Tk picks the item
+        # under the pointer, which it does on every motion event during drags
+        self.canvas.itemconfig("static", state="disabled")
 
         # Load saved settings
         self.load_settings()
@@ -1012,6 +1152,13 @@ class HamSimulatorApp(ctk.CTk):
         # Split Mode Toggle (Ctrl+')
         self.bind("<Control-apostrophe>", lambda e: self.toggle_split())
 
+        # Event-driven redraws: any click, drag or key posts <<RadioUpdate>>
+        self.bind("<<RadioUpdate>>", lambda e: self.redraw())
+        # (drag motion redraws are requested by the drag handlers, after throttling)
+        for sequence in ("<Button-1>", "<ButtonRelease-1>"):
+            self.canvas.bind(sequence, self.request_redraw, add="+")
+        self.bind_all("<KeyPress>", self.request_redraw, add="+")
+
         # Start Radio Thread
         self.thread = threading.Thread(target=self.radio_loop, daemon=True)
         self.thread.start()
@@ -1021,26 +1168,56 @@ class HamSimulatorApp(ctk.CTk):
         if HTTP_API_ENABLED:
             self.start_api_server()
 
-        # Start Animation Loop (100ms = 10 fps - more efficient)
+        # Start fallback redraw loop (picks up radio/API thread updates)
         self.animate()
 
+    @property
+    def frequency(self):
+        """VFO A frequency as a display string"""
+        return frequency_10hz_to_display(self.freq_a_10hz)
+
+    @frequency.setter
+    def frequency(self, value):
+        freq_10hz = frequency_display_to_10hz(value)
+        if freq_10hz is None:
+            raise ValueError(f"Invalid frequency format: {value!r}")
+        self.freq_a_10hz = freq_10hz
+
+    @property
+    def frequency_vfo_b(self):
+        """VFO B frequency as a display string"""
+        return frequency_10hz_to_display(self.freq_b_10hz)
+
+    @frequency_vfo_b.setter
+    def frequency_vfo_b(self, value):
+        freq_10hz = frequency_display_to_10hz(value)
+        if freq_10hz is None:
+            raise ValueError(f"Invalid frequency format: {value!r}")
+        self.freq_b_10hz = freq_10hz
+
+    def meter_readings(self):
+        """S, PO and SWR meter values for the API (last polled reading; displayed level in mock mode)"""
+        if MOCK_MODE:
+            return self.meter_level, self.power_meter_level, self.swr_level
+        return self.meter_target, self.power_meter_target, self.swr_target
+
     def draw_chassis(self):
         """Draws the static background elements"""
         # Main Faceplate bevels
-        self.canvas.create_line(0, 130, 1200, 130, fill="#111111", width=2) # Separation between display and controls
+        self.canvas.create_line(0, 130, 1200, 130, fill="#111111", width=2, tags="static") # Separation between display and controls
         
         # Yaesu Logo
-        self.canvas.create_text(160, 145, text="YAESU", fill="#cccccc", font=("Times New Roman", 16, "bold"))
-        self.canvas.create_text(1050, 145, text="FT-1000MP  MARK-V", fill="#cccccc", font=("Arial", 12, "italic bold"))
+        self.canvas.create_text(160, 145, text="YAESU", fill="#cccccc", font=("Times New Roman", 16, "bold"), tags="static")
+        self.canvas.create_text(1050, 145, text="FT-1000MP  MARK-V", fill="#cccccc", font=("Arial", 12, "italic bold"), tags="static")
 
     def draw_display_window(self):
         """Draws the main black display area"""
         # The glass window
-        self.canvas.create_rectangle(50, 20, 1150, 120, fill=COLOR_DISPLAY_BG, outline="#444444", width=3)
+        self.canvas.create_rectangle(50, 20, 1150, 120, fill=COLOR_DISPLAY_BG, outline="#444444", width=3, tags="static")
         
         # Static labels inside display
-        self.canvas.create_text(80, 35, text="METER", fill="#555555", font=("Arial", 8), anchor="w")
-        self.canvas.create_text(80, 105, text="S / PO", fill="#555555", font=("Arial", 8), anchor="w")
+        self.canvas.create_text(80, 35, text="METER", fill="#555555", font=("Arial", 8), anchor="w", tags="static")
+        self.canvas.create_text(80, 105, text="S / PO", fill="#555555", font=("Arial", 8), anchor="w", tags="static")
 
     def draw_knobs(self):
         """Draws the VFO knobs"""
@@ -1058,7 +1235,9 @@ class HamSimulatorApp(ctk.CTk):
         
         # Finger Dimple (Dynamic - initialized here, moved in update)
         self.dimple_radius = 65
-        self.vfo_a_dimple = self.canvas.create_oval(0, 0, 20, 20, fill="#333333", outline="#000000")
+        self.vfo_a_dimple_lut = self.build_dimple_lut(cx, cy, self.dimple_radius)
+        ax, ay = self.vfo_a_dimple_lut[0]
+        self.vfo_a_dimple = self.canvas.create_oval(ax-8, ay-8, ax+8, ay+8, fill="#333333", outline="#000000")
         # Make VFO A knob interactive
         vfo_a_knob = self.canvas.create_oval(cx-r, cy-r, cx+r, cy+r, fill="", outline="", width=0)
         self.canvas.tag_bind(vfo_a_knob, "<Button-1>", lambda e: self.vfo_click("A"))
@@ -1073,7 +1252,9 @@ class HamSimulatorApp(ctk.CTk):
         
         # VFO B Dimple
         self.vfo_b_dimple_radius = 50
-        self.vfo_b_dimple = self.canvas.create_oval(0, 0, 16, 16, fill="#333333", outline="#000000")
+        self.vfo_b_dimple_lut = self.build_dimple_lut(bx, by, self.vfo_b_dimple_radius)
+        dbx, dby = self.vfo_b_dimple_lut[0]
+        self.vfo_b_dimple = self.canvas.create_oval(dbx-8, dby-8, dbx+8, dby+8, fill="#333333", outline="#000000")
         # Make VFO B knob interactive
         vfo_b_knob = self.canvas.create_oval(bx-br, by-br, bx+br, by+br, fill="", outline="", width=0)
         self.canvas.tag_bind(vfo_b_knob, "<Button-1>", lambda e: self.vfo_click("B"))
@@ -1082,18 +1263,27 @@ class HamSimulatorApp(ctk.CTk):
         
         # === Control Sliders (AF/RF/POWER) ===
         # AF GAIN Slider (Interactive)
-        self.draw_control_slider(80, 190, "AF GAIN", "af", 0, 100)
+        self.draw_control_slider(80, 190, "AF GAIN", "af", 0, 100, "af_gain")
         # SUB AF GAIN Slider (Interactive) - for VFO B
-        self.draw_control_slider(80, 235, "SUB AF", "sub_af", 0, 100)
+        self.draw_control_slider(80, 235, "SUB AF", "sub_af", 0, 100, "sub_af_gain")
         # RF GAIN Slider (Interactive)
-        self.draw_control_slider(80, 280, "RF GAIN", "rf", 0, 100)
+        self.draw_control_slider(80, 280, "RF GAIN", "rf", 0, 100, "rf_gain")
         # POWER Level Slider (Interactive)
-        self.draw_control_slider(80, 325, "POWER", "power", 0, 100)
+        self.draw_control_slider(80, 325, "POWER", "power", 0, 100, "power_level")
         # Interactive knobs on right side (SHIFT/WIDTH/NOTCH)
         self.draw_interactive_knob(1100, 250, "SHIFT", "shift")
         self.draw_interactive_knob(1100, 340, "WIDTH", "width")
         self.draw_interactive_knob(1100, 430, "NOTCH", "notch")
 
+    @staticmethod
+    def build_dimple_lut(cx, cy, radius):
+        """Dimple centers for each of the 1000 kHz-digit positions (10 turns per MHz)"""
+        lut = []
+        for khz in range(1000):
+            angle_rad = math.radians((khz / 1000.0) * 360 * 10)
+            lut.append((cx + radius * math.cos(angle_rad), cy + radius * math.sin(angle_rad)))
+        return tuple(lut)
+
     def draw_buttons(self):
         """Draws the keypad and mode buttons"""
         # Keypad Grid (functional)
@@ -1136,6 +1326,7 @@ class HamSimulatorApp(ctk.CTk):
             # LED Indicator (Dynamic)
             led = self.canvas.create_rectangle(mx-10, my+8, mx-4, my+18, fill=COLOR_LED_OFF, outline="", tags=mode_tag)
             self.ui_elements[f"led_{mode}"] = led
+            self.mode_led_ids[mode] = led
             # Bind click event to the tag
             self.canvas.tag_bind(mode_tag, "<Button-1>", lambda e, m=mode: self.mode_button_click(m))
             my += 35
@@ -1152,8 +1343,8 @@ class HamSimulatorApp(ctk.CTk):
         # XMIT Button
         self.draw_control_button(620, 430, "XMIT", "xmit")
 
-    def draw_control_slider(self, x, y, label, slider_id, min_val=0, max_val=100):
-        """Draw an interactive slider control with tick marks"""
+    def draw_control_slider(self, x, y, label, slider_id, min_val=0, max_val=100, value_attr=None):
+        """Draw an interactive slider control with tick marks (value_attr defaults to slider_id)"""
         slider_width = 100  # Reduced from 120
         slider_height = 14  # Reduced from 16
         
@@ -1202,11 +1393,8 @@ class HamSimulatorApp(ctk.CTk):
         self.ui_elements[f"{slider_id}_track"] = track
         self.ui_elements[f"{slider_id}_thumb"] = thumb
         self.ui_elements[f"{slider_id}_value"] = value_text
-        self.ui_elements[f"{slider_id}_x"] = x
-        self.ui_elements[f"{slider_id}_y"] = y
-        self.ui_elements[f"{slider_id}_width"] = slider_width
-        self.ui_elements[f"{slider_id}_min"] = min_val
-        self.ui_elements[f"{slider_id}_max"] = max_val
+        self.slider_items.append((value_attr or slider_id, thumb, value_text, x, y, slider_width))
+        self.slider_geometry[slider_id] = (x, slider_width, min_val, max_val)
         
         # Bind mouse events
         self.canvas.tag_bind(track, "<Button-1>", lambda e, sid=slider_id: self.slider_click(e, sid))
@@ -1231,9 +1419,8 @@ class HamSimulatorApp(ctk.CTk):
         self.ui_elements[f"{knob_id}_knob"] = knob
         self.ui_elements[f"{knob_id}_line"] = line
         self.ui_elements[f"{knob_id}_value"] = value_text
-        self.ui_elements[f"{knob_id}_x"] = x
-        self.ui_elements[f"{knob_id}_y"] = y
-        self.ui_elements[f"{knob_id}_last_angle"] = None
+        self.knob_last_angle[knob_id] = None
+        self.knob_items.append((knob_id, line, value_text, x, y))
         
         # Bind mouse events
         self.canvas.tag_bind(knob, "<Button-1>", lambda e, kid=knob_id: self.knob_click(e, kid, x, y))
@@ -1254,13 +1441,13 @@ class HamSimulatorApp(ctk.CTk):
         apf_freqs = [250, 500, 1000, 1500, 2000]
         for i, freq in enumerate(apf_freqs):
             y = base_y + 15 + (i * 22)
-            self.draw_filter_button(base_x, y, str(freq), f"apf_{freq}", 40)
+            self.draw_filter_button(base_x, y, str(freq), f"apf_{freq}", 40, led_group="apf_led")
         
         # NR filters (middle column) - 500, 1000, 1500, 2000, 3000
         nr_freqs = [500, 1000, 1500, 2000, 3000]
         for i, freq in enumerate(nr_freqs):
             y = base_y + 15 + (i * 22)
-            self.draw_filter_button(base_x + 45, y, str(freq), f"nr_{freq}", 40)
+            self.draw_filter_button(base_x + 45, y, str(freq), f"nr_{freq}", 40, led_group="nr_led")
         
         # NR OFF button (below NR column)
         y = base_y + 15 + (5 * 22)
@@ -1328,8 +1515,80 @@ class HamSimulatorApp(ctk.CTk):
         self.ui_elements["conn_led"] = led
         self.ui_elements["conn_status_text"] = status
 
-    def draw_filter_button(self, x, y, label, button_id, width=40):
-        """Draw a small filter matrix button"""
+    def draw_help_overlay(self):
+        """Draw the keyboard help overlay (hidden until toggled with Ctrl+H)"""
+        # Semi-transparent help overlay
+        self.canvas.create_rectangle(
+            0, 0, 1200, 480, fill="#000000", stipple="gray50",
+            state="hidden", tags="help_overlay"
+        )
+
+        # Help text (last line shows live memory/split state, refreshed in update_face)
+        help_lines = [
+            "KEYBOARD SHORTCUTS",
+            "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+            "↑ / ↓            : ±10 kHz frequency",
+            "Shift + ↑ / ↓    : ±1 kHz frequency",
+            "Ctrl + Left      : Toggle VFO A/B",
+            "Ctrl + M         : Cycle through modes",
+            "Ctrl + '         : Toggle Split Frequency Mode (TX/RX)",
+            "Ctrl + H         : Toggle this help",
+            "Ctrl + S         : Save settings",
+            "Alt + 0-9        : Recall memory channel 0-9",
+            "Alt + Shift 0-9  : Store current to memory 0-9",
+            "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
+            "Numeric Keypad   : Direct frequency entry",
+            "Click VFO Knobs  : Drag to tune | Click to select",
+            "Click Buttons    : Mode, antenna, tuner controls",
+            self.help_status_line(),
+        ]
+
+        help_y = 80
+        for i, line in enumerate(help_lines):
+            # Highlight title and header
+            if i == 0:
+                color = "#ffff00"  # Yellow for title
+                font = ("Arial", 14, "bold")
+            elif "━" in line:
+                color = "#888888"
+                font = ("Arial", 10)
+            elif "Current Memory" in line:
+                color = "#00ff00"
+                font = ("Arial", 10, "bold")
+            else:
+                color = "#cccccc"
+                font = ("Arial", 10)
+
+            text = self.canvas.create_text(
+                600, help_y,
+                text=line, fill=color, font=font, anchor="center",
+                state="hidden", tags="help_overlay"
+            )
+            help_y += 20
+
+        self.ui_elements["help_status_text"] = text
+
+    def help_status_line(self):
+        """Return the live memory/split line shown at the bottom of the help overlay"""
+        return f"Memory: {self.selected_memory}  |  Split: {'ON' if self.split_enabled else 'OFF'}"
+
+    def draw_status_banner(self):
+        """Draw the temporary status message banner (hidden until a message is shown)"""
+        # Banner at bottom center
+        self.canvas.create_rectangle(
+            400, 440, 800, 470,
+            fill="#004400", outline="#00ff00", width=2,
+            state="hidden", tags="status_msg"
+        )
+        text = self.canvas.create_text(
+            600, 455,
+            text="", fill="#00ff00", font=("Arial", 12, "bold"),
+            state="hidden", tags="status_msg"
+        )
+        self.ui_elements["status_msg_text"] = text
+
+    def draw_filter_button(self, x, y, label, button_id, width=40, led_group=None):
+        """Draw a small filter matrix button (led_group tags the LED for bulk updates)"""
         button_tag = f"filter_{button_id}"
         height = 18
         
@@ -1350,11 +1609,14 @@ class HamSimulatorApp(ctk.CTk):
         
         # LED indicator (small green square when active)
         led_size = 4
+        led_tags = (button_tag, f"{button_id}_led")
+        if led_group:
+            led_tags += (led_group,)
         led = self.canvas.create_rectangle(
             x + 3, y + 3,
             x + 3 + led_size, y + 3 + led_size,
             fill=COLOR_LED_OFF, outline="",
-            tags=button_tag
+            tags=led_tags
         )
         
         # Store elements
@@ -1435,10 +1697,7 @@ class HamSimulatorApp(ctk.CTk):
     def slider_drag(self, event, slider_id):
         """Handle slider dragging to adjust value"""
         # Get slider parameters
-        x = self.ui_elements[f"{slider_id}_x"]
-        slider_width = self.ui_elements[f"{slider_id}_width"]
-        min_val = self.ui_elements[f"{slider_id}_min"]
-        max_val = self.ui_elements[f"{slider_id}_max"]
+        x, slider_width, min_val, max_val = self.slider_geometry[slider_id]
         
         # Calculate value from mouse position
         left_edge = x - slider_width//2
@@ -1463,19 +1722,47 @@ class HamSimulatorApp(ctk.CTk):
             self.rf_gain = value
         elif slider_id == "power":
             self.power_level = value
+        self.sliders_dirty = True
+        self.request_redraw()
+
     def knob_click(self, event, knob_id, center_x, center_y):
         """Handle knob click - initialize angle tracking"""
         pass  # Angle tracking starts on first drag
 
+    def drag_throttled(self, replay):
+        """True if a drag event arrived too soon after the last handled one.
+
+        Skipped events leave the stored angle untouched, so the next handled
+        event picks up the whole movement. The latest skipped event is kept
+        as the replay callable and applied on button release by
+        flush_pending_drag(), so the final movement is not lost either.
+        """
+        now = time.monotonic()
+        if now - self.last_drag_time < DRAG_MIN_INTERVAL_S:
+            self.pending_drag = replay
+            return True
+        self.last_drag_time = now
+        self.pending_drag = None
+        return False
+
+    def flush_pending_drag(self):
+        """Apply a drag event skipped by drag_throttled() before the drag ends"""
+        replay, self.pending_drag = self.pending_drag, None
+        if replay is not None:
+            self.last_drag_time = 0.0
+            replay()
+
     def knob_drag(self, event, knob_id, center_x, center_y):
         """Handle knob dragging to adjust value"""
+        if self.drag_throttled(lambda: self.knob_drag(event, knob_id, center_x, center_y)):
+            return
         # Calculate angle from center
         dx = event.x - center_x
         dy = event.y - center_y
         angle = math.atan2(dy, dx)
         
         # Get the last angle for this knob
-        last_angle = self.ui_elements.get(f"{knob_id}_last_angle")
+        last_angle = self.knob_last_angle.get(knob_id)
         
         # If we have a previous angle, calculate the delta
         if last_angle is not None:
@@ -1499,13 +1786,16 @@ class HamSimulatorApp(ctk.CTk):
                 self.width = max(0, min(100, self.width + value_delta))
             elif knob_id == "notch":
                 self.notch = max(0, min(100, self.notch + value_delta))
+            self.sliders_dirty = True
         
         # Store current angle for next drag event
-        self.ui_elements[f"{knob_id}_last_angle"] = angle
+        self.knob_last_angle[knob_id] = angle
+        self.request_redraw()
 
     def knob_release(self, knob_id):
         """Reset angle tracking when mouse button is released"""
-        self.ui_elements[f"{knob_id}_last_angle"] = None
+        self.flush_pending_drag()
+        self.knob_last_angle[knob_id] = None
 
     def filter_button_click(self, button_id):
         """Handle filter matrix button clicks - mutually exclusive within each column"""
@@ -1576,7 +1866,7 @@ class HamSimulatorApp(ctk.CTk):
 
     def keypad_press(self, key):
         """Handle keypad button press"""
-        if key in '0123456789':
+        if key in DIGITS:
             # Add digit to buffer
             if len(self.freq_entry_buffer) < 8:  # Max 8 digits (e.g., 14320000 for 14.320.00)
                 self.freq_entry_buffer += key
@@ -1639,6 +1929,8 @@ class HamSimulatorApp(ctk.CTk):
 
     def vfo_drag(self, event, vfo, center_x, center_y):
         """Handle VFO knob dragging to tune frequency"""
+        if self.drag_throttled(lambda: self.vfo_drag(event, vfo, center_x, center_y)):
+            return
         # Calculate angle from center
         dx = event.x - center_x
         dy = event.y - center_y
@@ -1673,9 +1965,11 @@ class HamSimulatorApp(ctk.CTk):
             self.vfo_a_last_angle = angle
         else:
             self.vfo_b_last_angle = angle
+        self.request_redraw()
 
     def vfo_release(self, vfo):
         """Reset angle tracking when mouse button is released"""
+        self.flush_pending_drag()
         if vfo == "A":
             self.vfo_a_last_angle = None
         else:
@@ -1813,7 +2107,7 @@ class HamSimulatorApp(ctk.CTk):
                             print(f"CAT probe: 0 bytes with opcode 0x{opcode:02X} on {profile_name}")
                         continue
 
-                    if has_valid_frequency_in_payload(probe, opcode, status_param, self.frequency):
+                    if has_valid_frequency_in_payload(probe, opcode, status_param, self.freq_a_10hz):
                         self.cat_read_opcode_working = opcode
                         self.cat_read_status_param_working = status_param
                         self.cat_read_enabled = True
@@ -2255,6 +2549,7 @@ class HamSimulatorApp(ctk.CTk):
         This only updates the local UI slider value.
         """
         self.af_gain = max(0, min(100, int(level)))
+        self.sliders_dirty = True
         if CAT_DEBUG:
             print(f"[UI] AF Gain set to {self.af_gain} (local only - not sent to radio)")
     
@@ -2273,6 +2568,7 @@ class HamSimulatorApp(ctk.CTk):
         This only updates the local UI slider value.
         """
         self.sub_af_gain = max(0, min(100, int(level)))
+        self.sliders_dirty = True
         if CAT_DEBUG:
             print(f"[UI] Sub AF Gain set to {self.sub_af_gain} (local only - not sent to radio)")
 
@@ -2290,6 +2586,7 @@ class HamSimulatorApp(ctk.CTk):
         This updates the local UI and could be used for simulation.
         """
         self.power_level = max(0, min(100, int(level)))
+        self.sliders_dirty = True
         if CAT_DEBUG:
             print(f"[UI] RF Power level set to {self.power_level}")
 
@@ -2389,42 +2686,14 @@ class HamSimulatorApp(ctk.CTk):
     def adjust_frequency(self, vfo, delta_khz):
         """Adjust frequency by delta in kHz"""
         try:
+            # Frequencies are stored in 10Hz units (1432000 = 14.32000 MHz); limit to
+            # ham bands (1.8 - 30 MHz = 180000 - 3000000). No string work on this path.
             if vfo == "A":
-                freq_str = self.frequency.replace(".", "")
-                # Parse as integer in 10Hz units (e.g., "1432000" = 14.32000 MHz)
-                freq_10hz = int(freq_str)
-                # Convert to kHz: 1432000 → 14320.0 kHz
-                freq_khz = freq_10hz / 100.0
-                freq_khz += delta_khz
-                # Limit to ham bands (1.8 - 30 MHz)
-                freq_khz = max(1800, min(30000, freq_khz))
-                # Convert back to 10Hz units
-                freq_10hz = int(freq_khz * 100)
-                # Format: pad to at least 6 digits (minimum 1.800 MHz = 180000)
-                freq_str = f"{freq_10hz:06d}"
-                # Handle different lengths
-                if len(freq_str) == 6:  # 1-9 MHz: format as X.XXX.XX
-                    self.frequency = f"{freq_str[0]}.{freq_str[1:4]}.{freq_str[4:6]}"
-                elif len(freq_str) == 7:  # 10-29 MHz: format as XX.XXX.XX
-                    self.frequency = f"{freq_str[0:2]}.{freq_str[2:5]}.{freq_str[5:7]}"
-                else:  # 30 MHz: format as XX.XXX.XX
-                    self.frequency = f"{freq_str[0:2]}.{freq_str[2:5]}.{freq_str[5:7]}"
+                self.freq_a_10hz = max(180000, min(3000000, int(self.freq_a_10hz + delta_khz * 100)))
                 # Set appropriate mode for this frequency
                 self.set_mode_for_frequency("A")
             else:
-                freq_str = self.frequency_vfo_b.replace(".", "")
-                freq_10hz = int(freq_str)
-                freq_khz = freq_10hz / 100.0
-                freq_khz += delta_khz
-                freq_khz = max(1800, min(30000, freq_khz))
-                freq_10hz = int(freq_khz * 100)
-                freq_str = f"{freq_10hz:06d}"
-                if len(freq_str) == 6:
-                    self.frequency_vfo_b = f"{freq_str[0]}.{freq_str[1:4]}.{freq_str[4:6]}"
-                elif len(freq_str) == 7:
-                    self.frequency_vfo_b = f"{freq_str[0:2]}.{freq_str[2:5]}.{freq_str[5:7]}"
-                else:
-                    self.frequency_vfo_b = f"{freq_str[0:2]}.{freq_str[2:5]}.{freq_str[5:7]}"
+                self.freq_b_10hz = max(180000, min(3000000, int(self.freq_b_10hz + delta_khz * 100)))
                 # Set appropriate mode for this frequency
                 self.set_mode_for_frequency("B")
             
@@ -2447,7 +2716,7 @@ class HamSimulatorApp(ctk.CTk):
         # Active Text
         self.ui_elements["freq_a"] = self.canvas.create_text(640, 75, text=self.frequency, fill=COLOR_DISPLAY_ON, font=("Courier", 48, "bold"), anchor="e")
         self.ui_elements["mode_a"] = self.canvas.create_text(360, 40, text=self.mode, fill="#00ff00", font=("Arial", 12, "bold"))
-        self.canvas.create_text(640, 35, text="VFO A", fill="#cc5500", font=("Arial", 10, "bold"))
+        self.canvas.create_text(640, 35, text="VFO A", fill="#cc5500", font=("Arial", 10, "bold"), tags="static")
 
         # === Antenna Display (placed right-of-center, clear of VFO A/B labels) ===
         self.ui_elements["antenna_display"] = self.canvas.create_text(780, 35, text="ANT 1", fill=COLOR_DISPLAY_ON, font=("Arial", 10, "bold"))
@@ -2455,16 +2724,16 @@ class HamSimulatorApp(ctk.CTk):
         # === VFO B Display ===
         self.ui_elements["freq_b"] = self.canvas.create_text(1120, 75, text=self.frequency_vfo_b, fill=COLOR_DISPLAY_ON, font=("Courier", 48, "bold"), anchor="e")
         self.ui_elements["mode_b"] = self.canvas.create_text(920, 40, text=self.mode_vfo_b, fill="#00ff00", font=("Arial", 12, "bold"))
-        self.canvas.create_text(1120, 35, text="VFO B", fill="#cc5500", font=("Arial", 10, "bold"))
+        self.canvas.create_text(1120, 35, text="VFO B", fill="#cc5500", font=("Arial", 10, "bold"), tags="static")
 
         # === Meters ===
         # Labels for all meters - positioned on left side
-        self.canvas.create_text(70, 30, text="RX", fill="#888888", font=("Arial", 9, "bold"), anchor="w")
-        self.canvas.create_text(70, 55, text="PO", fill="#888888", font=("Arial", 9, "bold"), anchor="w")
-        self.canvas.create_text(70, 80, text="SWR", fill="#888888", font=("Arial", 9, "bold"), anchor="w")
+        self.canvas.create_text(70, 30, text="RX", fill="#888888", font=("Arial", 9, "bold"), anchor="w", tags="static")
+        self.canvas.create_text(70, 55, text="PO", fill="#888888", font=("Arial", 9, "bold"), anchor="w", tags="static")
+        self.canvas.create_text(70, 80, text="SWR", fill="#888888", font=("Arial", 9, "bold"), anchor="w", tags="static")
         
         # === RX Signal Strength Meter (S-Meter) - 25 segments ===
-        self.meter_segments = []
+        self.meter_segment_colors = []
         meter_x_start = 100
         meter_y = 30
         for i in range(25):
@@ -2472,42 +2741,84 @@ class HamSimulatorApp(ctk.CTk):
             if i > 17: color = "#ffff00" # Yellow
             if i > 21: color = "#ff0000" # Red
             
-            seg = self.canvas.create_rectangle(
+            self.canvas.create_rectangle(
                 meter_x_start + (i*7), meter_y, 
                 meter_x_start + (i*7) + 5, meter_y + 8, 
-                fill="#222", outline=""
+                fill="#222", outline="", tags=self.meter_level_tags("s_meter", i)
             )
-            self.meter_segments.append({'id': seg, 'on_color': color})
+            self.meter_segment_colors.append(color)
         
         # === Power Output Meter (25 segments) ===
-        self.power_meter_segments = []
+        self.power_meter_segment_colors = []
         power_meter_y = 55
         for i in range(25):
             color = "#00ff00" # Green
             if i > 17: color = "#ffff00" # Yellow
             if i > 21: color = "#ff0000" # Red
             
-            seg = self.canvas.create_rectangle(
+            self.canvas.create_rectangle(
                 meter_x_start + (i*7), power_meter_y, 
                 meter_x_start + (i*7) + 5, power_meter_y + 8, 
-                fill="#222", outline=""
+                fill="#222", outline="", tags=self.meter_level_tags("po_meter", i)
             )
-            self.power_meter_segments.append({'id': seg, 'on_color': color})
+            self.power_meter_segment_colors.append(color)
         
         # === SWR Meter (25 segments) ===
-        self.swr_meter_segments = []
+        self.swr_meter_segment_colors = []
         swr_meter_y = 80
         for i in range(25):
             color = "#00ff00" # Green for low SWR
             if i > 8: color = "#ffff00" # Yellow
             if i > 15: color = "#ff0000" # Red for high SWR
             
-            seg = self.canvas.create_rectangle(
+            self.canvas.create_rectangle(
                 meter_x_start + (i*7), swr_meter_y, 
                 meter_x_start + (i*7) + 5, swr_meter_y + 8, 
-                fill="#222", outline=""
+                fill="#222", outline="", tags=self.meter_level_tags("swr_meter", i)
             )
-            self.swr_meter_segments.append({'id': seg, 'on_color': color})
+            self.swr_meter_segment_colors.append(color)
+
+        # Same-color segment runs, so lighting a range takes one itemconfig per color
+        self.meter_color_runs = self.build_color_runs(self.meter_segment_colors)
+        self.power_meter_color_runs = self.build_color_runs(self.power_meter_segment_colors)
+        self.swr_meter_color_runs = self.build_color_runs(self.swr_meter_segment_colors)
+
+    @staticmethod
+    def meter_level_tags(prefix, index):
+        """Tags for meter segment `index`: "<prefix>_ge_<k>" for every k <= index.
+
+        Segments lo..hi-1 are then selected by the single tag expression
+        "<prefix>_ge_<lo> && !<prefix>_ge_<hi>".
+        """
+        return tuple(f"{prefix}_ge_{k}" for k in range(index + 1))
+
+    @staticmethod
+    def build_color_runs(colors):
+        """Collapse per-segment colors into (start, end, color) runs"""
+        runs = []
+        start = 0
+        for i in range(1, len(colors) + 1):
+            if i == len(colors) or colors[i] != colors[start]:
+                runs.append((start, i, colors[start]))
+                start = i
+        return tuple(runs)
+
+    def bind_item_ids(self):
+        """Copy the canvas ids update_face touches every frame into attributes"""
+        ui = self.ui_elements
+        self.freq_a_id = ui["freq_a"]
+        self.mode_a_id = ui["mode_a"]
+        self.freq_b_id = ui["freq_b"]
+        self.mode_b_id = ui["mode_b"]
+        self.antenna_display_id = ui["antenna_display"]
+        self.ant1_led_id = ui["ant1_led"]
+        self.ant2_led_id = ui["ant2_led"]
+        self.tuner_led_id = ui["tuner_led"]
+        self.vfo_switch_led_id = ui["vfo_switch_led"]
+        self.xmit_led_id = ui["xmit_led"]
+        self.nr_off_led_id = ui["nr_off_led"]
+        self.contour_mode_txt_id = ui["contour_mode_txt"]
+        self.contour_led_id = ui["contour_led"]
 
     def load_settings(self):
         """Load saved settings from JSON file"""
@@ -2618,14 +2929,18 @@ class HamSimulatorApp(ctk.CTk):
         self.status_message_until = time.time() + (duration_ms / 1000.0)
 
     def start_api_server(self):
-        """Start the HTTP API server in a background thread"""
+        """Start the HTTP API server in a single background thread.
+
+        Requests are handled one at a time on that thread (no per-request
+        threads), which keeps GIL contention with the UI and radio loops low.
+        """
         def run_server():
             try:
                 # Set the radio app reference for the handler
                 RadioAPIHandler.radio_app = self
                 
                 # Create and start server
-                self.api_server = ThreadingHTTPServer((HTTP_API_HOST, HTTP_API_PORT), RadioAPIHandler)
+                self.api_server = HTTPServer((HTTP_API_HOST, HTTP_API_PORT), RadioAPIHandler)
                 print(f"✓ HTTP API server started on http://{HTTP_API_HOST}:{HTTP_API_PORT}")
                 print(f"  Example: curl http://{HTTP_API_HOST}:{HTTP_API_PORT}/api/status")
                 
@@ -2642,6 +2957,7 @@ class HamSimulatorApp(ctk.CTk):
     def on_close(self):
         """Gracefully stop background threads and persist current settings."""
         self.running = False
+        self.stop_event.set()
         self.save_settings()
 
         if self.api_server is not None:
@@ -2664,15 +2980,60 @@ class HamSimulatorApp(ctk.CTk):
         self.destroy()
 
     def animate(self):
-        """Main UI Update Loop"""
+        """Fallback redraw loop for updates made off the main thread"""
+        if self.status_message:
+            self.needs_redraw = True  # Banner expiry is time-based
+        self.redraw()
+        self.after(ANIMATION_LOOP_MS, self.animate)
+
+    def request_redraw(self, event=None):
+        """Mark the face stale and post a redraw to the Tk event queue (main thread only)"""
+        self.needs_redraw = True
+        self.event_generate("<<RadioUpdate>>", when="tail")
+
+    def redraw(self):
+        """Redraw the face if anything changed since the last redraw"""
+        if not self.needs_redraw:
+            return
+        self.needs_redraw = False  # Clear first so updates made during the redraw are kept
         try:
-            # Clear help overlay from previous frame
-            self.canvas.delete("help_overlay")
             self.update_face()
         except Exception as e:
             print(f"UI Error: {e}")
-        
-        self.after(ANIMATION_LOOP_MS, self.animate)
+
+    def itemconfig_if_changed(self, item_id, **options):
+        """Queue canvas item options that differ from those already applied"""
+        last = self.last_item_state
+        for option, value in options.items():
+            key = (item_id, option)
+            if last.get(key) != value:
+                last[key] = value
+                self.pending_item_options.setdefault(item_id, {})[option] = value
+
+    def coords_if_changed(self, item_id, *coords):
+        """Set canvas item coordinates unless they are already in place"""
+        key = (item_id, "coords")
+        if self.last_item_state.get(key) != coords:
+            self.last_item_state[key] = coords
+            self.canvas.coords(item_id, *coords)
+
+    def flush_item_options(self):
+        """Issue the queued option changes, one itemconfig per item"""
+        itemconfig = self.canvas.itemconfig
+        for item_id, options in self.pending_item_options.items():
+            itemconfig(item_id, **options)
+        self.pending_item_options.clear()
+
+    def update_meter_segments(self, prefix, color_runs, active, last_active):
+        """Recolor only the meter segments between the old and new level, one call per color"""
+        itemconfig = self.canvas.itemconfig
+        if active > last_active:
+            for start, end, color in color_runs:
+                lo, hi = max(start, last_active), min(end, active)
+                if lo < hi:
+                    itemconfig(f"{prefix}_ge_{lo} && !{prefix}_ge_{hi}", fill=color)
+        else:
+            itemconfig(f"{prefix}_ge_{active} && !{prefix}_ge_{last_active}", fill="#222222")  # Off state
 
     def update_face(self):
         # 1. Update Frequency A (with caching for optimization)
@@ -2680,26 +3041,14 @@ class HamSimulatorApp(ctk.CTk):
         if self.active_vfo != "A": freq_a_color = "#885500" # Dim if inactive
         
         # Show entry buffer if in entry mode and VFO A is active
+        entry_display = format_entry_display(self.freq_entry_buffer) if self.freq_entry_mode else None
         freq_a_display = self.frequency
-        if self.freq_entry_mode and self.active_vfo == "A":
-            # Format partial entry for display
-            entry_padded = self.freq_entry_buffer.ljust(8, '_')
-            freq_a_display = f"{entry_padded[0:2]}.{entry_padded[2:5]}.{entry_padded[5:7]}"
-            if freq_a_display.startswith("_"):
-                freq_a_display = " " + freq_a_display[1:]
-        
-        # Only update if changed (optimization)
-        if freq_a_display != self.cached_freq_a:
-            self.canvas.itemconfig(self.ui_elements["freq_a"], text=freq_a_display, fill=freq_a_color)
-            self.cached_freq_a = freq_a_display
-        else:
-            # Still update color in case it changed to/from red
-            self.canvas.itemconfig(self.ui_elements["freq_a"], fill=freq_a_color)
+        if entry_display and self.active_vfo == "A":
+            freq_a_display = entry_display
         
-        # Only update mode if changed
-        if self.mode != self.cached_mode_a:
-            self.canvas.itemconfig(self.ui_elements["mode_a"], text=self.mode)
-            self.cached_mode_a = self.mode
+        # Only update text/color that changed (optimization)
+        self.itemconfig_if_changed(self.freq_a_id, text=freq_a_display, fill=freq_a_color)
+        self.itemconfig_if_changed(self.mode_a_id, text=self.mode)
 
         # 2. Update Frequency B (with caching for optimization)
         freq_b_color = COLOR_DISPLAY_RED if (self.transmitting and self.active_vfo == "B") else COLOR_DISPLAY_ON
@@ -2707,252 +3056,181 @@ class HamSimulatorApp(ctk.CTk):
         
         # Show entry buffer if in entry mode and VFO B is active
         freq_b_display = self.frequency_vfo_b
-        if self.freq_entry_mode and self.active_vfo == "B":
-            entry_padded = self.freq_entry_buffer.ljust(8, '_')
-            freq_b_display = f"{entry_padded[0:2]}.{entry_padded[2:5]}.{entry_padded[5:7]}"
-            if freq_b_display.startswith("_"):
-                freq_b_display = " " + freq_b_display[1:]
-        
-        # Only update if changed (optimization)
-        if freq_b_display != self.cached_freq_b:
-            self.canvas.itemconfig(self.ui_elements["freq_b"], text=freq_b_display, fill=freq_b_color)
-            self.cached_freq_b = freq_b_display
-        else:
-            # Still update color in case it changed to/from red
-            self.canvas.itemconfig(self.ui_elements["freq_b"], fill=freq_b_color)
+        if entry_display and self.active_vfo == "B":
+            freq_b_display = entry_display
         
-        # Only update mode if changed
-        if self.mode_vfo_b != self.cached_mode_b:
-            self.canvas.itemconfig(self.ui_elements["mode_b"], text=self.mode_vfo_b)
-            self.cached_mode_b = self.mode_vfo_b
+        # Only update text/color that changed (optimization)
+        self.itemconfig_if_changed(self.freq_b_id, text=freq_b_display, fill=freq_b_color)
+        self.itemconfig_if_changed(self.mode_b_id, text=self.mode_vfo_b)
 
         # 3. Update Antenna Display & Split Indicator (only if changed)
         antenna_text = f"ANT {self.antenna}"
         if self.split_enabled:
             antenna_text += " | SPLIT"
-        if antenna_text != self.cached_antenna:
-            self.canvas.itemconfig(self.ui_elements["antenna_display"], text=antenna_text)
-            self.cached_antenna = antenna_text
-
-        # 3b. Animate VFO A Knob (Rotate Dimple based on frequency)
-        try:
-            khz_part = int(self.frequency.replace(".", "")[-3:])
-            angle_rad = math.radians((khz_part / 1000.0) * 360 * 10)
-            
-            cx, cy = 480, 300
-            dx = cx + self.dimple_radius * math.cos(angle_rad)
-            dy = cy + self.dimple_radius * math.sin(angle_rad)
-            
-            self.canvas.coords(self.vfo_a_dimple, dx-8, dy-8, dx+8, dy+8)
-        except:
-            pass
+        self.itemconfig_if_changed(self.antenna_display_id, text=antenna_text)
+
+        # 3b. Animate VFO A Knob (Rotate Dimple based on frequency, precomputed positions)
+        # freq_*_10hz are ints, so the index is always 0-999 and no guard is needed
+        khz_part = self.freq_a_10hz % 1000
+        if khz_part != self.cached_dimple_a:
+            # Fixed-size oval: shift it by the center delta rather than rewriting its coords
+            ox, oy = self.vfo_a_dimple_lut[self.cached_dimple_a]
+            nx, ny = self.vfo_a_dimple_lut[khz_part]
+            self.canvas.move(self.vfo_a_dimple, nx - ox, ny - oy)
+            self.cached_dimple_a = khz_part
 
         # 3b. Animate VFO B Knob
-        try:
-            khz_part_b = int(self.frequency_vfo_b.replace(".", "")[-3:])
-            angle_rad_b = math.radians((khz_part_b / 1000.0) * 360 * 10)
-            
-            bx, by = 900, 300
-            dx_b = bx + self.vfo_b_dimple_radius * math.cos(angle_rad_b)
-            dy_b = by + self.vfo_b_dimple_radius * math.sin(angle_rad_b)
-            
-            self.canvas.coords(self.vfo_b_dimple, dx_b-8, dy_b-8, dx_b+8, dy_b+8)
-        except:
-            pass
+        khz_part_b = self.freq_b_10hz % 1000
+        if khz_part_b != self.cached_dimple_b:
+            ox, oy = self.vfo_b_dimple_lut[self.cached_dimple_b]
+            nx, ny = self.vfo_b_dimple_lut[khz_part_b]
+            self.canvas.move(self.vfo_b_dimple, nx - ox, ny - oy)
+            self.cached_dimple_b = khz_part_b
+
+        # 4. Update Meters (recolor only the segments between last and new level)
+        # Only this thread writes the levels. Real-radio readings are shown as polled;
+        # simulated ones are eased toward their targets at the same per-RADIO_LOOP_MS
+        # rate however often the face is redrawn.
+        if MOCK_MODE:
+            now = time.monotonic()
+            ticks = (now - self.last_meter_step) * 1000.0 / RADIO_LOOP_MS
+            self.last_meter_step = now
+            s_factor = 1 - (1 - METER_SMOOTHING) ** ticks
+            tx_factor = 1 - (1 - TX_METER_SMOOTHING) ** ticks
+            self.meter_level = smooth_toward(self.meter_level, self.meter_target, s_factor)
+            self.power_meter_level = smooth_toward(self.power_meter_level, self.power_meter_target, tx_factor)
+            self.swr_level = smooth_toward(self.swr_level, self.swr_target, tx_factor)
+            if (self.meter_level != self.meter_target
+                    or self.power_meter_level != self.power_meter_target
+                    or self.swr_level != self.swr_target):
+                self.needs_redraw = True  # Keep animating until the meters settle
+        else:
+            self.meter_level = self.meter_target
+            self.power_meter_level = self.power_meter_target
+            self.swr_level = self.swr_target
 
-        # 4. Update Meters (only if values change significantly or transmit state changes)
         # S-meter: meter_level is 0-255. Map to 0-25 segments.
-        active_segments = int((self.meter_level / 255.0) * 25)
-        if active_segments != self.cached_meter_level or self.transmitting != self.cached_transmitting:
-            for i, seg in enumerate(self.meter_segments):
-                if i < active_segments:
-                    self.canvas.itemconfig(seg['id'], fill=seg['on_color'])
-                else:
-                    self.canvas.itemconfig(seg['id'], fill="#222222") # Off state
+        active_segments = min(25, int((self.meter_level / 255.0) * 25))
+        if active_segments != self.cached_meter_level:
+            self.update_meter_segments(
+                "s_meter", self.meter_color_runs,
+                active_segments, self.cached_meter_level
+            )
             self.cached_meter_level = active_segments
-            self.cached_transmitting = self.transmitting
         
         # Power Output Meter — always show polled value (radio returns 0 on RX)
-        active_power_segments = int((self.power_meter_level / 255.0) * 25)
-        for i, seg in enumerate(self.power_meter_segments):
-            if i < active_power_segments:
-                self.canvas.itemconfig(seg['id'], fill=seg['on_color'])
-            else:
-                self.canvas.itemconfig(seg['id'], fill="#222222")
+        active_power_segments = min(25, int((self.power_meter_level / 255.0) * 25))
+        if active_power_segments != self.cached_power_meter_level:
+            self.update_meter_segments(
+                "po_meter", self.power_meter_color_runs,
+                active_power_segments, self.cached_power_meter_level
+            )
+            self.cached_power_meter_level = active_power_segments
 
         # SWR Meter — always show polled value (radio returns 0 on RX)
-        active_swr_segments = int((self.swr_level / 255.0) * 25)
-        for i, seg in enumerate(self.swr_meter_segments):
-            if i < active_swr_segments:
-                self.canvas.itemconfig(seg['id'], fill=seg['on_color'])
-            else:
-                self.canvas.itemconfig(seg['id'], fill="#222222")
+        active_swr_segments = min(25, int((self.swr_level / 255.0) * 25))
+        if active_swr_segments != self.cached_swr_level:
+            self.update_meter_segments(
+                "swr_meter", self.swr_meter_color_runs,
+                active_swr_segments, self.cached_swr_level
+            )
+            self.cached_swr_level = active_swr_segments
 
-        # 5. Update Mode LEDs
-        modes = ["LSB", "USB", "CW", "AM", "FM"]
+        # 5. Update Mode LEDs (only when the active VFO's mode changes)
         current_mode = self.mode if self.active_vfo == "A" else self.mode_vfo_b
-        
-        for m in modes:
-            led_color = COLOR_LED_GREEN if m == current_mode else COLOR_LED_OFF
-            if f"led_{m}" in self.ui_elements:
-                self.canvas.itemconfig(self.ui_elements[f"led_{m}"], fill=led_color)
-
-        # 6. Update Control Sliders
-        # AF GAIN
-        if "af_thumb" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["af_value"], text=str(self.af_gain))
-            # Update thumb position
-            x = self.ui_elements["af_x"]
-            y = self.ui_elements["af_y"]
-            slider_width = self.ui_elements["af_width"]
-            thumb_pos = x - slider_width//2 + (self.af_gain / 100.0) * slider_width
-            thumb_width = 7
-            slider_height = 14
-            self.canvas.coords(
-                self.ui_elements["af_thumb"],
-                thumb_pos - thumb_width//2, y - slider_height//2 - 2,
-                thumb_pos + thumb_width//2, y + slider_height//2 + 2
-            )
-        
-        # SUB AF GAIN
-        if "sub_af_thumb" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["sub_af_value"], text=str(self.sub_af_gain))
-            # Update thumb position
-            x = self.ui_elements["sub_af_x"]
-            y = self.ui_elements["sub_af_y"]
-            slider_width = self.ui_elements["sub_af_width"]
-            thumb_pos = x - slider_width//2 + (self.sub_af_gain / 100.0) * slider_width
+        if current_mode != self.cached_current_mode:
+            # Only the previously lit LED and the new one change
+            mode_led_ids = self.mode_led_ids
+            if self.cached_current_mode in mode_led_ids:
+                self.canvas.itemconfig(mode_led_ids[self.cached_current_mode], fill=COLOR_LED_OFF)
+            if current_mode in mode_led_ids:
+                self.canvas.itemconfig(mode_led_ids[current_mode], fill=COLOR_LED_GREEN)
+            self.cached_current_mode = current_mode
+
+        # 6. Update Control Sliders (only when a slider/knob value changed)
+        if self.sliders_dirty:
+            # Clear first so a change made by another thread mid-render is not lost
+            self.sliders_dirty = False
+
+            itemconfig_if_changed = self.itemconfig_if_changed
+            coords_if_changed = self.coords_if_changed
+
+            # AF GAIN, SUB AF, RF GAIN, POWER sliders: value text and thumb position
             thumb_width = 7
             slider_height = 14
-            self.canvas.coords(
-                self.ui_elements["sub_af_thumb"],
-                thumb_pos - thumb_width//2, y - slider_height//2 - 2,
-                thumb_pos + thumb_width//2, y + slider_height//2 + 2
-            )
-        
-        # RF GAIN
-        if "rf_thumb" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["rf_value"], text=str(self.rf_gain))
-            # Update thumb position
-            x = self.ui_elements["rf_x"]
-            y = self.ui_elements["rf_y"]
-            slider_width = self.ui_elements["rf_width"]
-            thumb_pos = x - slider_width//2 + (self.rf_gain / 100.0) * slider_width
-            thumb_width = 7
-            slider_height = 14
-            self.canvas.coords(
-                self.ui_elements["rf_thumb"],
-                thumb_pos - thumb_width//2, y - slider_height//2 - 2,
-                thumb_pos + thumb_width//2, y + slider_height//2 + 2
-            )
-        
-        # POWER Level
-        if "power_thumb" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["power_value"], text=str(self.power_level))
-            # Update thumb position
-            x = self.ui_elements["power_x"]
-            y = self.ui_elements["power_y"]
-            slider_width = self.ui_elements["power_width"]
-            thumb_pos = x - slider_width//2 + (self.power_level / 100.0) * slider_width
-            thumb_width = 7
-            slider_height = 14
-            self.canvas.coords(
-                self.ui_elements["power_thumb"],
-                thumb_pos - thumb_width//2, y - slider_height//2 - 2,
-                thumb_pos + thumb_width//2, y + slider_height//2 + 2
-            )
+            for value_attr, thumb, value_text, x, y, slider_width in self.slider_items:
+                value = getattr(self, value_attr)
+                itemconfig_if_changed(value_text, text=str(value))
+                thumb_pos = x - slider_width//2 + (value / 100.0) * slider_width
+                coords_if_changed(
+                    thumb,
+                    thumb_pos - thumb_width//2, y - slider_height//2 - 2,
+                    thumb_pos + thumb_width//2, y + slider_height//2 + 2
+                )
 
-        # 7. Update Interactive Knobs (SHIFT, WIDTH, NOTCH)
-        # SHIFT knob
-        if "shift_line" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["shift_value"], text=str(int(self.shift)))
-            # Update indicator line position based on value (0-100 maps to -135° to +135°)
-            angle = ((self.shift / 100.0) * 270 - 135) * (math.pi / 180)
-            x, y = self.ui_elements["shift_x"], self.ui_elements["shift_y"]
-            x2 = x + 23 * math.sin(angle)
-            y2 = y - 23 * math.cos(angle)
-            self.canvas.coords(self.ui_elements["shift_line"], x, y, x2, y2)
-        
-        # WIDTH knob
-        if "width_line" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["width_value"], text=str(int(self.width)))
-            angle = ((self.width / 100.0) * 270 - 135) * (math.pi / 180)
-            x, y = self.ui_elements["width_x"], self.ui_elements["width_y"]
-            x2 = x + 23 * math.sin(angle)
-            y2 = y - 23 * math.cos(angle)
-            self.canvas.coords(self.ui_elements["width_line"], x, y, x2, y2)
-        
-        # NOTCH knob
-        if "notch_line" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["notch_value"], text=str(int(self.notch)))
-            angle = ((self.notch / 100.0) * 270 - 135) * (math.pi / 180)
-            x, y = self.ui_elements["notch_x"], self.ui_elements["notch_y"]
-            x2 = x + 23 * math.sin(angle)
-            y2 = y - 23 * math.cos(angle)
-            self.canvas.coords(self.ui_elements["notch_line"], x, y, x2, y2)
+            # 7. Update Interactive Knobs (SHIFT, WIDTH, NOTCH)
+            for value_attr, line, value_text, x, y in self.knob_items:
+                value = int(getattr(self, value_attr))
+                itemconfig_if_changed(value_text, text=str(value))
+                # Indicator line end for the displayed value (precomputed, whole pixels)
+                dx, dy = KNOB_LINE_OFFSETS[value]
+                coords_if_changed(line, x, y, x + dx, y + dy)
 
         # 7. Update Antenna and Tuner LEDs
-        if "ant1_led" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["ant1_led"], 
-                                  fill=COLOR_LED_GREEN if self.antenna == 1 else COLOR_LED_OFF)
-        if "ant2_led" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["ant2_led"], 
-                                  fill=COLOR_LED_GREEN if self.antenna == 2 else COLOR_LED_OFF)
-        if "tuner_led" in self.ui_elements:
-            self.canvas.itemconfig(self.ui_elements["tuner_led"], 
-                                  fill=COLOR_LED_GREEN if self.tuner_active else COLOR_LED_OFF)
-        if "vfo_switch_led" in self.ui_elements:
-            # Show which VFO is active: green for B, off for A
-            self.canvas.itemconfig(self.ui_elements["vfo_switch_led"], 
-                                  fill=COLOR_LED_GREEN if self.active_vfo == "B" else COLOR_LED_OFF)
-        if "xmit_led" in self.ui_elements:
-            # Show transmit status: red when transmitting
-            led_color = COLOR_DISPLAY_RED if self.transmitting else COLOR_LED_OFF
-            self.canvas.itemconfig(self.ui_elements["xmit_led"], fill=led_color)
-
-        # 8. Update Filter Matrix LEDs
-        # APF filters
-        for freq in self.apf_filters:
-            if f"apf_{freq}_led" in self.ui_elements:
-                led_color = COLOR_LED_GREEN if self.apf_filters[freq] else COLOR_LED_OFF
-                self.canvas.itemconfig(self.ui_elements[f"apf_{freq}_led"], fill=led_color)
-        
-        # NR filters
-        for freq in self.nr_filters:
-            if f"nr_{freq}_led" in self.ui_elements:
-                led_color = COLOR_LED_GREEN if self.nr_filters[freq] else COLOR_LED_OFF
-                self.canvas.itemconfig(self.ui_elements[f"nr_{freq}_led"], fill=led_color)
+        itemconfig_if_changed = self.itemconfig_if_changed
+        itemconfig_if_changed(self.ant1_led_id, fill=COLOR_LED_GREEN if self.antenna == 1 else COLOR_LED_OFF)
+        itemconfig_if_changed(self.ant2_led_id, fill=COLOR_LED_GREEN if self.antenna == 2 else COLOR_LED_OFF)
+        itemconfig_if_changed(self.tuner_led_id, fill=COLOR_LED_GREEN if self.tuner_active else COLOR_LED_OFF)
+        # Show which VFO is active: green for B, off for A
+        itemconfig_if_changed(self.vfo_switch_led_id, fill=COLOR_LED_GREEN if self.active_vfo == "B" else COLOR_LED_OFF)
+        # Show transmit status: red when transmitting
+        itemconfig_if_changed(self.xmit_led_id, fill=COLOR_DISPLAY_RED if self.transmitting else COLOR_LED_OFF)
+
+        # 8. Update Filter Matrix LEDs (group tag off, then light the enabled ones)
+        filter_state = (tuple(self.apf_filters.items()), tuple(self.nr_filters.items()))
+        if filter_state != self.cached_filter_state:
+            # APF filters
+            self.canvas.itemconfig("apf_led", fill=COLOR_LED_OFF)
+            for freq, enabled in self.apf_filters.items():
+                if enabled:
+                    self.canvas.itemconfig(f"apf_{freq}_led", fill=COLOR_LED_GREEN)
+
+            # NR filters
+            self.canvas.itemconfig("nr_led", fill=COLOR_LED_OFF)
+            for freq, enabled in self.nr_filters.items():
+                if enabled:
+                    self.canvas.itemconfig(f"nr_{freq}_led", fill=COLOR_LED_GREEN)
+            self.cached_filter_state = filter_state
         
         # NR OFF button
-        if "nr_off_led" in self.ui_elements:
-            led_color = COLOR_LED_GREEN if self.nr_off else COLOR_LED_OFF
-            self.canvas.itemconfig(self.ui_elements["nr_off_led"], fill=led_color)
+        itemconfig_if_changed(self.nr_off_led_id, fill=COLOR_LED_GREEN if self.nr_off else COLOR_LED_OFF)
         
         # CONTOUR button - update mode text and LED color
-        if "contour_mode_txt" in self.ui_elements:
-            contour_modes = ["OFF", "L-CUT", "M-CUT", "H-CUT"]
-            mode_text = contour_modes[self.contour_mode]
-            self.canvas.itemconfig(self.ui_elements["contour_mode_txt"], text=mode_text, fill="#ff9900")
-        
-        if "contour_led" in self.ui_elements:
-            # Different LED colors for different modes
-            contour_colors = [COLOR_LED_OFF, "#ffaa00", "#00ff00", "#00aaff"]  # OFF, orange, green, blue
-            led_color = contour_colors[self.contour_mode]
-            self.canvas.itemconfig(self.ui_elements["contour_led"], fill=led_color)
-        
-        # 9. Update Connection Status
-        if "conn_port_text" in self.ui_elements:
-            if MOCK_MODE:
+        itemconfig_if_changed(self.contour_mode_txt_id, text=CONTOUR_MODE_LABELS[self.contour_mode], fill="#ff9900")
+        itemconfig_if_changed(self.contour_led_id, fill=CONTOUR_LED_COLORS[self.contour_mode])
+        
+        # 9. Update Connection Status (only on state transitions)
+        serial_port = self.serial_port
+        if MOCK_MODE:
+            conn_state = ("mock",)
+        elif serial_port and serial_port.is_open:
+            port_name = serial_port.port if hasattr(serial_port, 'port') else "CONNECTED"
+            conn_state = ("connected", port_name, self.cat_read_enabled)
+        else:
+            conn_state = ("disconnected",)
+
+        if "conn_port_text" in self.ui_elements and conn_state != self.cached_conn_state:
+            self.cached_conn_state = conn_state
+            if conn_state[0] == "mock":
                 # Demo mode - orange
                 self.canvas.itemconfig(self.ui_elements["conn_port_text"], text="", fill="#ff9900")
                 self.canvas.itemconfig(self.ui_elements["conn_led"], fill="#ff9900")
                 self.canvas.itemconfig(self.ui_elements["conn_status_text"], text="", fill="#ff9900")
-            elif self.serial_port and self.serial_port.is_open:
+            elif conn_state[0] == "connected":
                 # Connected - green - display actual port name
-                port_name = self.serial_port.port if hasattr(self.serial_port, 'port') else "CONNECTED"
-                self.canvas.itemconfig(self.ui_elements["conn_port_text"], text=port_name, fill="#aaa")
+                self.canvas.itemconfig(self.ui_elements["conn_port_text"], text=conn_state[1], fill="#aaa")
                 self.canvas.itemconfig(self.ui_elements["conn_led"], fill="#00ff00")
-                if self.cat_read_enabled:
+                if conn_state[2]:
                     status_text = "CONNECTED"
                     status_color = "#00ff00"
                 else:
@@ -2965,74 +3243,30 @@ class HamSimulatorApp(ctk.CTk):
                 self.canvas.itemconfig(self.ui_elements["conn_led"], fill="#ff3333")
                 self.canvas.itemconfig(self.ui_elements["conn_status_text"], text="DISCONNECTED", fill="#ff3333")
         
-        # 10. Draw Help Overlay (if enabled via Ctrl+H)
+        # 10. Show/hide Help Overlay (toggled via Ctrl+H)
+        if self.show_help != self.cached_show_help:
+            self.canvas.itemconfig("help_overlay", state="normal" if self.show_help else "hidden")
+            self.cached_show_help = self.show_help
         if self.show_help:
-            # Semi-transparent help overlay
-            self.canvas.create_rectangle(0, 0, 1200, 480, fill="#000000", stipple="gray50", tags="help_overlay")
-            
-            # Help text
-            help_lines = [
-                "KEYBOARD SHORTCUTS",
-                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-                "↑ / ↓            : ±10 kHz frequency",
-                "Shift + ↑ / ↓    : ±1 kHz frequency",
-                "Ctrl + Left      : Toggle VFO A/B",
-                "Ctrl + M         : Cycle through modes",
-                "Ctrl + '         : Toggle Split Frequency Mode (TX/RX)",
-                "Ctrl + H         : Toggle this help",
-                "Ctrl + S         : Save settings",
-                "Alt + 0-9        : Recall memory channel 0-9",
-                "Alt + Shift 0-9  : Store current to memory 0-9",
-                "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━",
-                "Numeric Keypad   : Direct frequency entry",
-                "Click VFO Knobs  : Drag to tune | Click to select",
-                "Click Buttons    : Mode, antenna, tuner controls",
-                f"Memory: {self.selected_memory}  |  Split: {'ON' if self.split_enabled else 'OFF'}",
-            ]
-            
-            help_y = 80
-            for i, line in enumerate(help_lines):
-                # Highlight title and header
-                if i == 0:
-                    color = "#ffff00"  # Yellow for title
-                    font = ("Arial", 14, "bold")
-                elif "━" in line:
-                    color = "#888888"
-                    font = ("Arial", 10)
-                elif "Current Memory" in line:
-                    color = "#00ff00"
-                    font = ("Arial", 10, "bold")
-                else:
-                    color = "#cccccc"
-                    font = ("Arial", 10)
-                
-                self.canvas.create_text(
-                    600, help_y,
-                    text=line, fill=color, font=font, anchor="center",
-                    tags="help_overlay"
-                )
-                help_y += 20
-        
-        # 11. Display temporary status messages (if active)
+            help_status = self.help_status_line()
+            if help_status != self.cached_help_status:
+                self.canvas.itemconfig(self.ui_elements["help_status_text"], text=help_status)
+                self.cached_help_status = help_status
+
+        # 11. Display temporary status messages (only on show/expire transitions)
         if self.status_message and time.time() < self.status_message_until:
-            self.canvas.delete("status_msg")
-            # Draw status message banner at bottom center
-            self.canvas.create_rectangle(
-                400, 440, 800, 470,
-                fill="#004400", outline="#00ff00", width=2,
-                tags="status_msg"
-            )
-            self.canvas.create_text(
-                600, 455,
-                text=self.status_message,
-                fill="#00ff00", font=("Arial", 12, "bold"),
-                tags="status_msg"
-            )
-        else:
-            # Clear expired messages
-            self.canvas.delete("status_msg")
-            if time.time() >= self.status_message_until:
-                self.status_message = None
+            if self.status_message != self.cached_status_message:
+                self.canvas.itemconfig(self.ui_elements["status_msg_text"], text=self.status_message)
+                self.canvas.itemconfig("status_msg", state="normal")
+                self.cached_status_message = self.status_message
+        elif self.cached_status_message is not None:
+            # Hide expired message once
+            self.canvas.itemconfig("status_msg", state="hidden")
+            self.cached_status_message = None
+            self.status_message = None
+
+        # 12. Apply all queued text/color changes in one pass
+        self.flush_item_options()
 
     def radio_loop(self):
         """Handles serial communication in background"""
@@ -3061,19 +3295,28 @@ class HamSimulatorApp(ctk.CTk):
                         retry_count += 1
                         print(f"Connection attempt {retry_count}/{max_retries} failed: {e}")
                         if retry_count < max_retries:
-                            time.sleep(1)  # Wait before retrying
+                            if self.stop_event.wait(1):  # Wait before retrying
+                                return
                         else:
                             raise e
                 
             except Exception as e:
                 print(f"Error opening serial port after retries: {e}")
                 self.serial_port = None
+                self.needs_redraw = True
                 return
 
+        # Last state the face was asked to show; None so the first pass always redraws
+        # (the port was opened after the initial update_face)
+        face_state = None
         while self.running:
             if MOCK_MODE:
                 self.simulate_radio()
-                time.sleep(0.05) # Faster update for smooth animation
+                new_state = self.radio_face_state()
+                if new_state != face_state:
+                    face_state = new_state
+                    self.needs_redraw = True
+                self.stop_event.wait(RADIO_LOOP_MS / 1000.0) # Faster update for smooth animation
                 continue
 
             try:
@@ -3107,23 +3350,23 @@ class HamSimulatorApp(ctk.CTk):
                         po_val  = self.read_panel_meter(0x80)   # PO meter
                         swr_val = self.read_panel_meter(0x85)   # SWR meter
                         s_val   = None  # Do not poll S-meter during TX
-                        self.meter_level = 0  # Force RX S-meter dark during TX
+                        self.meter_target = 0  # Force RX S-meter dark during TX
                     else:
                         s_val   = self.read_panel_meter(0x00)   # S-meter
                         po_val  = self.read_panel_meter(0x80)   # PO meter
                         swr_val = self.read_panel_meter(0x85)   # SWR meter
 
                     if s_val is not None:
-                        self.meter_level = s_val
+                        self.meter_target = s_val
 
                     if local_tx:
                         # During TX, latch the most recent valid readings and do not decay.
                         got_tx_meter = False
                         if po_val is not None:
-                            self.power_meter_level = po_val
+                            self.power_meter_target = po_val
                             got_tx_meter = True
                         if swr_val is not None:
-                            self.swr_level = swr_val
+                            self.swr_target = swr_val
                             got_tx_meter = True
 
                         if got_tx_meter:
@@ -3132,19 +3375,23 @@ class HamSimulatorApp(ctk.CTk):
                     else:
                         # RX mode — accept PO/SWR only if they diverge clearly from the
                         # concurrent S-meter reading (indicates front-panel TX in progress).
-                        s_ref = s_val if s_val is not None else int(self.meter_level)
+                        s_ref = s_val if s_val is not None else self.meter_target
                         if po_val is not None and abs(po_val - s_ref) > 20:
-                            self.power_meter_level = po_val
+                            self.power_meter_target = po_val
                             self.last_tx_meter_update = now
                         else:
-                            self.power_meter_level = max(0, self.power_meter_level - 2)
+                            self.power_meter_target = max(0, self.power_meter_target - 2)
                         if swr_val is not None and abs(swr_val - s_ref) > 20:
-                            self.swr_level = swr_val
+                            self.swr_target = swr_val
                             self.last_tx_meter_update = now
                         else:
-                            self.swr_level = max(0, self.swr_level - 2)
+                            self.swr_target = max(0, self.swr_target - 2)
 
-                time.sleep(CAT_POLL_INTERVAL_S)
+                new_state = self.radio_face_state()
+                if new_state != face_state:
+                    face_state = new_state
+                    self.needs_redraw = True
+                self.stop_event.wait(CAT_POLL_INTERVAL_S)
 
             except Exception as e:
                 print(f"Serial Error: {e}")
@@ -3170,7 +3417,8 @@ class HamSimulatorApp(ctk.CTk):
                     except Exception as reconnect_error:
                         print(f"Reconnection failed: {reconnect_error}")
                         self.serial_port = None
-                time.sleep(1)
+                self.needs_redraw = True  # Connection state may have changed
+                self.stop_event.wait(1)
 
     def parse_freq_data(self, data):
         """Parse frequency data from radio"""
@@ -3180,15 +3428,14 @@ class HamSimulatorApp(ctk.CTk):
                 vfo_a_10hz, vfo_b_10hz = choose_stable_vfo_assignment(
                     decoded_1,
                     decoded_2,
-                    self.frequency,
-                    self.frequency_vfo_b,
+                    self.freq_a_10hz,
+                    self.freq_b_10hz,
                 )
                 if vfo_a_10hz is None:
                     return
 
-                selected_freq = frequency_10hz_to_display(vfo_a_10hz)
                 if vfo_b_10hz is not None:
-                    self.frequency_vfo_b = frequency_10hz_to_display(vfo_b_10hz)
+                    self.freq_b_10hz = vfo_b_10hz
 
                 if CAT_SYNC_MODE_FROM_STATUS and time.time() >= self.mode_sync_block_until and len(data) >= 24:
                     rec_a = data[0:16]
@@ -3229,97 +3476,86 @@ class HamSimulatorApp(ctk.CTk):
                         self.tx_meter_hold_until = time.time() + 0.40
 
                 # Require two consecutive matching reads before updating UI.
-                if selected_freq == self.last_polled_freq:
+                if vfo_a_10hz == self.last_polled_freq:
                     self.last_polled_freq_hits += 1
                 else:
-                    self.last_polled_freq = selected_freq
+                    self.last_polled_freq = vfo_a_10hz
                     self.last_polled_freq_hits = 1
 
                 if self.last_polled_freq_hits >= 2:
-                    self.frequency = selected_freq
+                    self.freq_a_10hz = vfo_a_10hz
                 return
 
-            selected_freq = select_frequency_from_stream(data, self.frequency)
-            if not selected_freq:
+            selected_10hz = select_frequency_from_stream(data, self.freq_a_10hz)
+            if selected_10hz is None:
                 return
 
             # Require two consecutive matching reads before updating UI.
-            if selected_freq == self.last_polled_freq:
+            if selected_10hz == self.last_polled_freq:
                 self.last_polled_freq_hits += 1
             else:
-                self.last_polled_freq = selected_freq
+                self.last_polled_freq = selected_10hz
                 self.last_polled_freq_hits = 1
 
             if self.last_polled_freq_hits >= 2:
-                self.frequency = selected_freq
+                self.freq_a_10hz = selected_10hz
         except Exception as e:
             print(f"Error parsing frequency data: {e}")
             import traceback
             traceback.print_exc()
 
+    def radio_face_state(self):
+        """Snapshot of the radio-thread-written values the face displays"""
+        return (self.freq_a_10hz, self.freq_b_10hz, self.mode, self.mode_vfo_b, self.antenna,
+                self.meter_target, self.power_meter_target, self.swr_target,
+                self.serial_port is not None, self.cat_read_enabled)
+
     def simulate_radio(self):
         """Enhanced simulation for smooth animation"""
-        import random
-        t = time.time()
-        
+        rand = self.sim_rng.random
+
+        # Base signal varies with time (simulating fading), one ring step per tick
+        self.sim_frame = (self.sim_frame + 1) % SIM_RING_SIZE
+        base_signal = SIM_BASE_SIGNAL[self.sim_frame]
+
         if self.transmitting:
             # Simulate output power based on power level setting
             target_power = int((self.power_level / 100.0) * 250)  # Scale to 0-250
-            # Add slight variation
-            target_power += random.randint(-5, 5)
-            target_power = max(0, min(255, target_power))
-            self.power_meter_level += (target_power - self.power_meter_level) * 0.3
+            # Add slight variation (-5..+5)
+            target_power += int(rand() * 11) - 5
+            self.power_meter_target = max(0, min(255, target_power))
             
             # Simulate SWR (usually good, occasionally spikes)
-            if random.random() > 0.95:
-                target_swr = random.randint(80, 150)  # Occasional high SWR
+            if rand() > 0.95:
+                target_swr = 80 + int(rand() * 71)  # Occasional high SWR (80-150)
             else:
-                target_swr = random.randint(20, 50)  # Normal low SWR (1.5:1 range)
-            self.swr_level += (target_swr - self.swr_level) * 0.3
-            
-            # S-meter can still show signals while transmitting
-            base_signal = int(abs(math.sin(t * 5)) * 200)
-            target_meter = int(base_signal * (self.rf_gain / 100.0))
+                target_swr = 20 + int(rand() * 31)  # Normal low SWR (20-50, 1.5:1 range)
+            self.swr_target = target_swr
         else:
-            # Not transmitting - power and SWR meters go to zero
-            self.power_meter_level *= 0.7  # Smooth decay
-            self.swr_level *= 0.7
-            
-            # Simulate received signal - affected by RF gain
-            # Base signal varies with time (simulating fading)
-            base_signal = int(abs(math.sin(t * 5)) * 200)
-            # Apply RF gain attenuation: rf_gain of 0 = no signal, 100 = full signal
-            target_meter = int(base_signal * (self.rf_gain / 100.0))
-            
-        # Smooth meter movement
-        self.meter_level += (target_meter - self.meter_level) * 0.2
+            # Not transmitting - power and SWR meters go to zero (update_face smooths the decay)
+            self.power_meter_target = 0
+            self.swr_target = 0
+
+        # Simulated received signal - affected by RF gain (also shown while transmitting)
+        # Apply RF gain attenuation: rf_gain of 0 = no signal, 100 = full signal
+        self.meter_target = int(base_signal * (self.rf_gain / 100.0))
 
     def set_mode_for_frequency(self, vfo):
         """Set appropriate mode based on frequency (LSB below 10 MHz, USB above)"""
-        try:
-            if vfo == "A":
-                freq_str = self.frequency.replace(".", "")
-                # Parse as integer in 10Hz units, convert to MHz
-                freq_mhz = int(freq_str) / 100000.0
-                # Below 10 MHz use LSB, above use USB
-                if freq_mhz < 10.0:
-                    self.mode = "LSB"
-                else:
-                    self.mode = "USB"
-            else:
-                freq_str = self.frequency_vfo_b.replace(".", "")
-                freq_mhz = int(freq_str) / 100000.0
-                if freq_mhz < 10.0:
-                    self.mode_vfo_b = "LSB"
-                else:
-                    self.mode_vfo_b = "USB"
-        except Exception as e:
-            print(f"Mode setting error: {e}")
+        freq_10hz = self.freq_a_10hz if vfo == "A" else self.freq_b_10hz
+        mode = "LSB" if freq_10hz < MODE_SWITCH_FREQ_10HZ else "USB"
+        if vfo == "A":
+            self.mode = mode
+        else:
+            self.mode_vfo_b = mode
 
 
 # Main execution
 if __name__ == "__main__":
     app = HamSimulatorApp()
+    # Shut down cleanly (stop API server, close serial, save settings) on SIGTERM.
+    # Deferred to the Tk loop so the window is never destroyed mid-redraw.
+    signal.signal(signal.SIGTERM, lambda *_: app.after_idle(app.on_close))
     try:
         app.mainloop()
     except KeyboardInterrupt:
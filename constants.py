@@ -9,10 +9,12 @@ WINDOW_HEIGHT = 480
 WINDOW_TITLE = "WT1W Ham Monitor - Virtual FT-1000MP"
 
 # Animation & Update Rates
-ANIMATION_LOOP_MS = 50   # milliseconds (20 fps) for more responsive meter movement
+ANIMATION_LOOP_MS = 100  # Fallback redraw poll; input events redraw immediately
 RADIO_LOOP_MS = 50       # Serial communication loop
 METER_SMOOTHING = 0.2    # 0.0-1.0: Higher = more responsive
+TX_METER_SMOOTHING = 0.3 # Same, for the PO and SWR meters
 KNOB_SMOOTHING = 0.3     # For VFO and control knobs
+DRAG_MIN_INTERVAL_S = 0.016  # Handle knob drag motion at most ~60 times/sec
 
 # Frequency Tuning (via keyboard)
 KEYBOARD_COARSE_STEP = 10    # kHz (arrow keys)
@@ -5,64 +5,123 @@ Demonstrates basic API usage
 """
 
 import requests
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import sys
+import time
 
 API_BASE = "http://127.0.0.1:8080/api"
 
+# One shared session for all calls (connection pooling instead of a new
+# client per request); the demo only ever talks to a single local host.
+# Transient failures are retried by urllib3 on the pooled connection, and
+# every API call here is idempotent, so POSTs are safe to retry too.
+RETRY = Retry(total=3, backoff_factor=0.05, status_forcelist=(502, 503, 504),
+              allowed_methods=frozenset(["GET", "POST"]))
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=RETRY))
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Prepared POST requests per API path; URL and headers are built once and
+# only the body changes per call
+_prepared_posts = {}
+
+def _post(path, payload):
+    """POST a compact JSON body to an API path on the shared session"""
+    prepared = _prepared_posts.get(path)
+    if prepared is None:
+        prepared = SESSION.prepare_request(
+            requests.Request("POST", f"{API_BASE}{path}", headers=_JSON_HEADERS))
+        _prepared_posts[path] = prepared
+    request = prepared.copy()
+    request.body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    request.headers["Content-Length"] = str(len(request.body))
+    _expire_cached()
+    return SESSION.send(request)
+
+STATUS_TEMPLATE = (
+    "VFO A: {frequency_a} - {mode_a}\n"
+    "VFO B: {frequency_b} - {mode_b}\n"
+    "Active VFO: {active_vfo}\n"
+    "Split: {split}\n"
+    "Transmitting: {tx}\n"
+    "AF Gain: {af_gain}  RF Gain: {rf_gain}  Power: {power_level}\n"
+    "Meter Level: {meter_level}\n"
+    "Memory: {selected_memory}"
+)
+
+# Whole status render, written to stdout in one call
+STATUS_BLOCK = "\n{rule}\nRADIO STATUS\n{rule}\n" + STATUS_TEMPLATE + "\n{rule}\n"
+
+# Last GET body per API path: [etag, parsed JSON, monotonic fetch time].
+# Within the TTL the cached body is returned without a request; after it
+# the ETag is revalidated and an unchanged body comes back as 304.
+_get_cache = {}
+
+def _expire_cached():
+    """Force the next get_cached() of every path to revalidate (after a write)"""
+    for entry in _get_cache.values():
+        entry[2] = float("-inf")
+
+def get_cached(path, ttl=0.2):
+    """GET an API path, reusing the cached JSON within ttl seconds"""
+    entry = _get_cache.get(path)
+    now = time.monotonic()
+    if entry is not None and now - entry[2] < ttl:
+        return entry[1]
+    headers = {"If-None-Match": entry[0]} if entry is not None and entry[0] else {}
+    response = SESSION.get(f"{API_BASE}{path}", headers=headers)
+    response.raise_for_status()
+    if response.status_code == 304:
+        entry[2] = now
+    else:
+        entry = _get_cache[path] = [response.headers.get("ETag"), response.json(), now]
+    return entry[1]
+
+# Status body last rendered and its text; a cache hit or 304 hands back the
+# same parsed body, so the block is reused without formatting again
+_rendered_status = {"data": None, "block": ""}
+
 def print_status():
     """Get and display full radio status"""
-    print("\n" + "="*60)
-    print("RADIO STATUS")
-    print("="*60)
-    
-    response = requests.get(f"{API_BASE}/status")
-    if response.status_code == 200:
-        data = response.json()
-        print(f"VFO A: {data['frequency_a']} - {data['mode_a']}")
-        print(f"VFO B: {data['frequency_b']} - {data['mode_b']}")
-        print(f"Active VFO: {data['active_vfo']}")
-        print(f"Split: {'ON' if data['split_enabled'] else 'OFF'}")
-        print(f"Transmitting: {'YES' if data['transmitting'] else 'NO'}")
-        print(f"AF Gain: {data['af_gain']}  RF Gain: {data['rf_gain']}  Power: {data['power_level']}")
-        print(f"Meter Level: {int(data['meter_level'])}")
-        print(f"Memory: {data['selected_memory']}")
-    else:
-        print(f"Error: {response.status_code}")
-    print("="*60)
+    data = get_cached("/status")
+    if data is not _rendered_status["data"]:
+        _rendered_status["data"] = data
+        _rendered_status["block"] = STATUS_BLOCK.format_map({
+            **data,
+            'rule': "="*60,
+            'split': 'ON' if data['split_enabled'] else 'OFF',
+            'tx': 'YES' if data['transmitting'] else 'NO',
+            'meter_level': int(data['meter_level']),
+        })
+    sys.stdout.write(_rendered_status["block"])
+    sys.stdout.flush()
 
 def set_frequency(freq, vfo="A"):
     """Set frequency"""
     print(f"\nSetting VFO {vfo} to {freq}...")
-    response = requests.post(f"{API_BASE}/frequency", 
-                            json={"frequency": freq, "vfo": vfo})
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✓ Set to {data['frequency']}")
-    else:
-        print(f"✗ Error: {response.text}")
+    response = _post("/frequency", {"frequency": freq, "vfo": vfo})
+    response.raise_for_status()
+    data = response.json()
+    print(f"✓ Set to {data['frequency']}")
 
 def set_mode(mode, vfo="A"):
     """Set mode"""
     print(f"\nSetting VFO {vfo} to {mode}...")
-    response = requests.post(f"{API_BASE}/mode",
-                            json={"mode": mode, "vfo": vfo})
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✓ Set to {data['mode']}")
-    else:
-        print(f"✗ Error: {response.text}")
+    response = _post("/mode", {"mode": mode, "vfo": vfo})
+    response.raise_for_status()
+    data = response.json()
+    print(f"✓ Set to {data['mode']}")
 
 def toggle_split(enable):
     """Toggle split mode"""
     state = "ON" if enable else "OFF"
     print(f"\nTurning split mode {state}...")
-    response = requests.post(f"{API_BASE}/split",
-                            json={"enable": enable})
-    if response.status_code == 200:
-        print(f"✓ Split mode: {state}")
-    else:
-        print(f"✗ Error: {response.text}")
+    response = _post("/split", {"enable": enable})
+    response.raise_for_status()
+    print(f"✓ Split mode: {state}")
 
 def set_controls(af_gain=None, rf_gain=None, power=None):
     """Set control values"""
@@ -75,12 +134,19 @@ def set_controls(af_gain=None, rf_gain=None, power=None):
     if power is not None:
         data['power_level'] = power
     
-    response = requests.post(f"{API_BASE}/controls", json=data)
-    if response.status_code == 200:
-        result = response.json()
-        print(f"✓ Updated: {result['updated']}")
-    else:
-        print(f"✗ Error: {response.text}")
+    response = _post("/controls", data)
+    response.raise_for_status()
+    result = response.json()
+    print(f"✓ Updated: {result['updated']}")
+
+def apply(**settings):
+    """Apply several settings (vfo, frequency, mode, split, controls) in one request"""
+    print(f"\nApplying {settings}...")
+    response = _post("/batch", settings)
+    response.raise_for_status()
+    result = response.json()
+    applied = {k: v for k, v in result.items() if k != 'success'}
+    print(f"✓ Applied: {applied}")
 
 def run_demo():
     """Run a full demonstration of the API"""
@@ -91,39 +157,30 @@ def run_demo():
     try:
         # Initial status
         print_status()
-        time.sleep(1)
         
         # Change to 20m FT8
         print("\n--- Test 1: Change to 20m FT8 ---")
-        set_frequency("14.074.00")
-        set_mode("USB")
-        time.sleep(1)
+        apply(vfo="A", frequency="14.074.00", mode="USB")
         print_status()
         
         # Change to 40m CW
         print("\n--- Test 2: Change to 40m CW ---")
-        set_frequency("7.030.00")
-        set_mode("CW")
-        time.sleep(1)
+        apply(vfo="A", frequency="7.030.00", mode="CW")
         print_status()
         
         # Enable split operation
         print("\n--- Test 3: Enable Split Mode ---")
-        set_frequency("14.250.00", "B")
-        toggle_split(True)
-        time.sleep(1)
+        apply(vfo="B", frequency="14.250.00", split=True)
         print_status()
         
         # Adjust controls
         print("\n--- Test 4: Adjust Gains ---")
         set_controls(af_gain=75, rf_gain=90, power=50)
-        time.sleep(1)
         print_status()
         
         # Disable split
         print("\n--- Test 5: Disable Split Mode ---")
         toggle_split(False)
-        time.sleep(1)
         print_status()
         
         print("\n" + "#"*60)
@@ -134,8 +191,11 @@ def run_demo():
         print("\n✗ ERROR: Cannot connect to API server")
         print("  Make sure the Ham Radio Monitor application is running")
         print("  and HTTP_API_ENABLED = True in constants.py")
+    except requests.exceptions.HTTPError as e:
+        print(f"\n✗ ERROR: {e.response.status_code} {e.response.text}")
     except Exception as e:
         print(f"\n✗ ERROR: {e}")
 
 if __name__ == "__main__":
-    run_demo()
+    with SESSION:  # Close pooled connections on exit
+        run_demo()